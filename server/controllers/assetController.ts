@@ -1,29 +1,28 @@
 import { Request, Response } from 'express';
 import Asset from '../models/Asset';
-import awsService from '../services/awsService';
+import awsService, { UPLOAD_CACHE_CONTROL } from '../services/awsService';
 import ttsService from '../services/ttsService';
 import multer from 'multer';
+import { MAX_UPLOAD_SIZE, isAllowedMimeType } from '../utils/uploadRules';
+import { resizeAvatar } from '../utils/image';
+
+// Asset types that can be uploaded straight to S3 with a presigned URL.
+// Audio still goes through the server so it can be cloned with ElevenLabs,
+// and avatars so they are stored pre-sized.
+const directUploadTypes = new Set(['video']);
+
+// S3 prefix for a user's direct uploads of one asset type
+const userUploadPrefix = (type: string, req: Request): string =>
+  `assets/${type}s/${req.user?._id}/`;
 
 // Configure multer for memory storage
 const upload = multer({
   storage: multer.memoryStorage(),
   limits: {
-    fileSize: 50 * 1024 * 1024, // 50MB limit
+    fileSize: MAX_UPLOAD_SIZE,
   },
   fileFilter: (req, file, cb) => {
-    const allowedMimes = [
-      'image/jpeg',
-      'image/png',
-      'image/gif',
-      'video/mp4',
-      'video/avi',
-      'video/mov',
-      'audio/mp3',
-      'audio/wav',
-      'audio/mpeg'
-    ];
-    
-    if (allowedMimes.includes(file.mimetype)) {
+    if (isAllowedMimeType(file.mimetype)) {
       cb(null, true);
     } else {
       cb(new Error('Invalid file type'));
@@ -31,6 +30,26 @@ const upload = multer({
   }
 });
 
+// Create an ElevenLabs voice clone from an uploaded audio file.
+// Failures are logged and swallowed so they never fail the upload itself.
+const createVoiceClone = async (req: Request): Promise<string | undefined> => {
+  try {
+    console.log('Creating ElevenLabs voice clone from uploaded audio...');
+    const voiceId = await ttsService.cloneVoice({
+      name: `${req.user?.displayName || 'User'}_Voice_${Date.now()}`,
+      description: `Custom voice for ${req.user?.displayName || 'user'}`,
+      audioFile: req.file!.buffer
+    });
+
+    console.log(`ElevenLabs voice created with ID: ${voiceId}`);
+    return voiceId;
+  } catch (voiceError) {
+    console.error('Failed to create ElevenLabs voice:', voiceError);
+    // Don't fail the upload, just log the error
+    return undefined;
+  }
+};
+
 // @desc    Upload asset
 // @route   POST /api/assets/upload
 // @access  Private
@@ -65,13 +84,41 @@ export const uploadAsset = async (req: Request, res: Response) => {
         const extension = req.file.originalname.split('.').pop();
         const fileName = `${type}_${timestamp}.${extension}`;
 
-        // Upload to S3
-        const fileUrl = await awsService.uploadFile(
-          req.file.buffer,
-          fileName,
-          req.file.mimetype,
-          `assets/${type}s`
-        );
+        // Avatars are stored pre-sized so every render reuses the small copy
+        let fileBuffer = req.file.buffer;
+        if (type === 'avatar') {
+          try {
+            fileBuffer = await resizeAvatar(req.file.buffer, req.file.mimetype);
+          } catch (imageError) {
+            console.error('Avatar Resize Error:', imageError);
+            return res.status(400).json({
+              success: false,
+              message: 'Invalid or corrupt image file'
+            });
+          }
+        }
+
+        // Upload to S3 and, for audio files, create the ElevenLabs voice clone
+        // concurrently - both only need the uploaded buffer.
+        const [uploadResult, cloneResult] = await Promise.allSettled([
+          awsService.uploadFile(
+            fileBuffer,
+            fileName,
+            req.file.mimetype,
+            `assets/${type}s`
+          ),
+          type === 'audio' ? createVoiceClone(req) : Promise.resolve(undefined)
+        ]);
+        const elevenLabsVoiceId = cloneResult.status === 'fulfilled' ? cloneResult.value : undefined;
+
+        if (uploadResult.status === 'rejected') {
+          // Don't leave an orphaned ElevenLabs voice behind when the upload failed
+          if (elevenLabsVoiceId) {
+            await ttsService.deleteVoice(elevenLabsVoiceId);
+          }
+          throw uploadResult.reason;
+        }
+        const fileUrl = uploadResult.value;
 
         // Save asset metadata to database
         const asset = await Asset.create({
@@ -79,31 +126,12 @@ export const uploadAsset = async (req: Request, res: Response) => {
           type,
           fileUrl,
           fileName: req.file.originalname,
-          fileSize: req.file.size,
+          fileSize: fileBuffer.length,
           mimeType: req.file.mimetype,
-          usedIn: []
+          usedIn: [],
+          elevenLabsVoiceId
         });
 
-        // If this is an audio file for voice cloning, create ElevenLabs voice
-        if (type === 'audio') {
-          try {
-            console.log('Creating ElevenLabs voice clone from uploaded audio...');
-            const voiceId = await ttsService.cloneVoice({
-              name: `${req.user?.displayName || 'User'}_Voice_${Date.now()}`,
-              description: `Custom voice for ${req.user?.displayName || 'user'}`,
-              audioFile: req.file.buffer
-            });
-            
-            // Store the ElevenLabs voice ID in the asset metadata
-            asset.elevenLabsVoiceId = voiceId;
-            await asset.save();
-            
-            console.log(`ElevenLabs voice created with ID: ${voiceId}`);
-          } catch (voiceError) {
-            console.error('Failed to create ElevenLabs voice:', voiceError);
-            // Don't fail the upload, just log the error
-          }
-        }
         res.status(201).json({
           success: true,
           asset
@@ -125,6 +153,140 @@ export const uploadAsset = async (req: Request, res: Response) => {
   }
 };
 
+// @desc    Get a presigned URL for uploading an asset directly to S3
+// @route   POST /api/assets/upload-url
+// @access  Private
+export const getAssetUploadUrl = async (req: Request, res: Response) => {
+  try {
+    const { type, fileName, mimeType, fileSize } = req.body;
+
+    if (!type || !directUploadTypes.has(type)) {
+      return res.status(400).json({
+        success: false,
+        message: 'Invalid asset type for direct upload'
+      });
+    }
+
+    if (!fileName || !mimeType || !isAllowedMimeType(mimeType)) {
+      return res.status(400).json({
+        success: false,
+        message: 'Invalid file type'
+      });
+    }
+
+    // The size is signed into the URL, so S3 itself enforces the limit
+    if (!Number.isInteger(fileSize) || fileSize <= 0 || fileSize > MAX_UPLOAD_SIZE) {
+      return res.status(400).json({
+        success: false,
+        message: 'Invalid file size'
+      });
+    }
+
+    // Keys live under the uploader's own prefix so createAsset can tell
+    // whose object a key refers to
+    const extension = fileName.split('.').pop().replace(/[^a-zA-Z0-9]/g, '');
+    const fileKey = `${userUploadPrefix(type, req)}${type}_${Date.now()}.${extension}`;
+    const uploadUrl = await awsService.getUploadUrl(fileKey, mimeType, fileSize);
+
+    res.status(200).json({
+      success: true,
+      uploadUrl,
+      fileKey,
+      // The PUT must send these; the browser adds Content-Length itself
+      uploadHeaders: {
+        'Content-Type': mimeType,
+        'Cache-Control': UPLOAD_CACHE_CONTROL
+      }
+    });
+  } catch (error) {
+    console.error('Get Upload URL Error:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Failed to create upload URL'
+    });
+  }
+};
+
+// @desc    Register an asset uploaded directly to S3
+// @route   POST /api/assets
+// @access  Private
+export const createAsset = async (req: Request, res: Response) => {
+  try {
+    const { type, fileKey, fileName, mimeType } = req.body;
+
+    if (!type || !directUploadTypes.has(type)) {
+      return res.status(400).json({
+        success: false,
+        message: 'Invalid asset type for direct upload'
+      });
+    }
+
+    if (!fileName || !mimeType || !isAllowedMimeType(mimeType)) {
+      return res.status(400).json({
+        success: false,
+        message: 'Invalid file type'
+      });
+    }
+
+    // Only keys handed out to this user by getAssetUploadUrl can be registered
+    if (typeof fileKey !== 'string' || !fileKey.startsWith(userUploadPrefix(type, req))) {
+      return res.status(400).json({
+        success: false,
+        message: 'Invalid file key'
+      });
+    }
+
+    const fileUrl = awsService.getFileUrl(fileKey);
+    const [file, existing] = await Promise.all([
+      awsService.headFile(fileKey),
+      Asset.exists({ fileUrl })
+    ]);
+    if (!file) {
+      return res.status(400).json({
+        success: false,
+        message: 'Uploaded file not found'
+      });
+    }
+
+    if (existing) {
+      return res.status(400).json({
+        success: false,
+        message: 'Asset already registered'
+      });
+    }
+
+    // The signed URL already pins type and size; this catches anything else
+    // that landed under the user's prefix
+    if (file.contentType !== mimeType || file.size > MAX_UPLOAD_SIZE) {
+      return res.status(400).json({
+        success: false,
+        message: 'Uploaded file does not match the upload request'
+      });
+    }
+
+    const asset = await Asset.create({
+      userId: req.user?._id,
+      type,
+      fileUrl,
+      fileName,
+      fileSize: file.size,
+      mimeType,
+      usedIn: []
+    });
+
+    res.status(201).json({
+      success: true,
+      asset
+    });
+  } catch (error) {
+    console.error('Create Asset Error:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Failed to register asset'
+    });
+  }
+};
+
 // @desc    Get user's assets
 // @route   GET /api/assets
 // @access  Private
@@ -220,7 +382,7 @@ export const deleteAsset = async (req: Request, res: Response) => {
     }
     // Delete from S3
     try {
-      const fileKey = asset.fileUrl.split('/').slice(-2).join('/'); // Extract key from URL
+      const fileKey = awsService.getFileKey(asset.fileUrl);
       await awsService.deleteFile(fileKey);
     } catch (s3Error) {
       console.error('S3 Delete Error:', s3Error);
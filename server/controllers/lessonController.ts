@@ -3,8 +3,10 @@ import Lesson from '../models/Lesson';
 import LearningPath from '../models/LearningPath';
 import Video from '../models/Video';
 import groqService from '../services/groqService';
-import videoService from '../services/videoService';
+import videoService, { MAX_SCRIPT_LENGTH } from '../services/videoService';
 import lessonGenerationService from '../services/lessonGenerationService';
+import { CustomError } from '../middleware/errorHandler';
+import logger from '../utils/logger';
 
 // @desc    Create new lesson
 // @route   POST /api/lessons
@@ -221,9 +223,9 @@ export const generateLessonVideo = async (req: Request, res: Response) => {
     const { avatarId, voiceId } = req.body;
     const lessonId = req.params.id;
 
-    console.log(`Starting video generation for lesson: ${lessonId}`);
-    console.log(`Request body:`, { avatarId, voiceId });
-    console.log(`User ID: ${req.user?._id}`);
+    logger.debug('Starting video generation for lesson: %s', lessonId);
+    logger.debug('Request body:', { avatarId, voiceId });
+    logger.debug('User ID: %s', req.user?._id);
 
     // Validate request data
     if (!avatarId || !voiceId) {
@@ -233,9 +235,13 @@ export const generateLessonVideo = async (req: Request, res: Response) => {
       });
     }
 
-    const lesson = await Lesson.findById(lessonId);
+    // The lesson and any existing video are independent lookups
+    const [lesson, existingVideo] = await Promise.all([
+      Lesson.findById(lessonId),
+      Video.findOne({ lessonId })
+    ]);
     if (!lesson) {
-      console.log(`Lesson not found: ${lessonId}`);
+      logger.debug('Lesson not found: %s', lessonId);
       return res.status(404).json({
         success: false,
         message: 'Lesson not found'
@@ -243,7 +249,7 @@ export const generateLessonVideo = async (req: Request, res: Response) => {
     }
 
     if (lesson.userId.toString() !== req.user?._id.toString()) {
-      console.log(`Unauthorized access to lesson: ${lessonId} by user: ${req.user?._id}`);
+      logger.debug('Unauthorized access to lesson: %s by user: %s', lessonId, req.user?._id);
       return res.status(403).json({
         success: false,
         message: 'Not authorized to access this lesson'
@@ -252,25 +258,33 @@ export const generateLessonVideo = async (req: Request, res: Response) => {
 
     // Check if lesson has a script
     if (!lesson.script || lesson.script.trim().length === 0) {
-      console.log(`Lesson script is missing or empty for lesson: ${lessonId}`);
+      logger.debug('Lesson script is missing or empty for lesson: %s', lessonId);
       return res.status(400).json({
         success: false,
         message: 'Lesson script is required for video generation'
       });
     }
 
+    // Reject oversized scripts before any TTS or rendering work is queued
+    if (lesson.script.length > MAX_SCRIPT_LENGTH) {
+      logger.debug('Lesson script too long for lesson: %s (%s characters)', lessonId, lesson.script.length);
+      return res.status(400).json({
+        success: false,
+        message: `Lesson script must be at most ${MAX_SCRIPT_LENGTH} characters for video generation`
+      });
+    }
+
     // Check if video already exists
-    const existingVideo = await Video.findOne({ lessonId });
     if (existingVideo) {
-      console.log(`Video already exists for lesson: ${lessonId}`);
+      logger.debug('Video already exists for lesson: %s', lessonId);
       return res.status(400).json({
         success: false,
         message: 'Video already exists for this lesson'
       });
     }
 
-    console.log(`Calling video service for lesson: ${lessonId}`);
-    console.log(`Script length: ${lesson.script.length} characters`);
+    logger.debug('Calling video service for lesson: %s', lessonId);
+    logger.debug('Script length: %s characters', lesson.script.length);
 
     // Start video generation process
     const video = await videoService.generateVideo({
@@ -281,7 +295,7 @@ export const generateLessonVideo = async (req: Request, res: Response) => {
       voiceId
     });
 
-    console.log(`Video generation started successfully for lesson: ${lessonId}`);
+    logger.debug('Video generation started successfully for lesson: %s', lessonId);
 
     res.status(201).json({
       success: true,
@@ -289,6 +303,13 @@ export const generateLessonVideo = async (req: Request, res: Response) => {
       message: 'Video generation started'
     });
   } catch (error) {
+    if ((error as CustomError).statusCode === 429) {
+      return res.status(429).json({
+        success: false,
+        message: (error as CustomError).message
+      });
+    }
+
     console.error('Video Generation Error:', error);
     console.error('Error stack:', error instanceof Error ? error.stack : 'No stack trace');
     res.status(500).json({
@@ -1,4 +1,5 @@
 import { Request, Response } from 'express';
+import crypto from 'crypto';
 import Video from '../models/Video';
 import Lesson from '../models/Lesson';
 import videoService from '../services/videoService';
@@ -182,11 +183,12 @@ export const getAvailableVoices = async (req: Request, res: Response) => {
 // @access  Private
 export const cleanupTempFiles = async (req: Request, res: Response) => {
   try {
-    await videoService.cleanup();
+    // Run the cleanup in the background; it logs its own failures
+    void videoService.cleanup();
     
-    res.status(200).json({
+    res.status(202).json({
       success: true,
-      message: 'Temporary files cleaned up successfully'
+      message: 'Temporary file cleanup started'
     });
   } catch (error) {
     console.error('Cleanup Error:', error);
@@ -215,4 +217,43 @@ export const checkDIDHealth = async (req: Request, res: Response) => {
       message: 'Failed to check D-ID service health'
     });
   }
-};
\ No newline at end of file
+};
+
+// @desc    Receive D-ID talk completion callbacks
+// @route   POST /api/videos/did/webhook
+// @access  Public (shared-secret token)
+export const handleDIDWebhook = async (req: Request, res: Response) => {
+  try {
+    const secret = Buffer.from(process.env.D_ID_WEBHOOK_SECRET || '');
+    const token = Buffer.from(typeof req.query.token === 'string' ? req.query.token : '');
+
+    // timingSafeEqual throws on differing byte lengths, so compare those first
+    if (!secret.length || token.length !== secret.length ||
+        !crypto.timingSafeEqual(token, secret)) {
+      return res.status(401).json({
+        success: false,
+        message: 'Invalid webhook token'
+      });
+    }
+
+    if (!req.body?.id || !req.body?.status) {
+      return res.status(400).json({
+        success: false,
+        message: 'Talk id and status are required'
+      });
+    }
+
+    const updated = await videoService.handleDIDWebhook(req.body);
+
+    res.status(200).json({
+      success: true,
+      updated
+    });
+  } catch (error) {
+    console.error('D-ID Webhook Error:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Failed to process D-ID webhook'
+    });
+  }
+};
@@ -9,6 +9,7 @@ export interface IVideo extends Document {
   voiceId: mongoose.Types.ObjectId;
   durationSec: number;
   status: 'generating' | 'completed' | 'failed';
+  didTalkId?: string;
   generatedAt: Date;
   createdAt: Date;
 }
@@ -58,6 +59,12 @@ const videoSchema = new Schema<IVideo>({
     enum: ['generating', 'completed', 'failed'],
     default: 'generating'
   },
+  // D-ID talk rendering this video, used to match completion webhooks
+  didTalkId: {
+    type: String,
+    index: true,
+    sparse: true
+  },
   generatedAt: {
     type: Date,
     default: Date.now
@@ -68,4 +75,7 @@ const videoSchema = new Schema<IVideo>({
   }
 });
 
+// Lookup of earlier renders with the same avatar and audio
+videoSchema.index({ avatarId: 1, audioUrl: 1, status: 1 });
+
 export default mongoose.model<IVideo>('Video', videoSchema);
\ No newline at end of file
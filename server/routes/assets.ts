@@ -1,6 +1,8 @@
 import express from 'express';
 import { 
   uploadAsset,
+  getAssetUploadUrl,
+  createAsset,
   getUserAssets,
   getAsset,
   deleteAsset,
@@ -13,6 +15,8 @@ const router = express.Router();
 router.use(protect); // All routes are protected
 
 router.post('/upload', uploadAsset);
+router.post('/upload-url', getAssetUploadUrl);
+router.post('/', createAsset);
 router.get('/', getUserAssets);
 router.get('/:id', getAsset);
 router.delete('/:id', deleteAsset);
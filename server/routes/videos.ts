@@ -6,13 +6,17 @@ import {
   deleteVideo,
   getAvailableVoices,
   cleanupTempFiles,
-  checkDIDHealth
+  checkDIDHealth,
+  handleDIDWebhook
 } from '../controllers/videoController';
 import { protect } from '../middleware/auth';
 
 const router = express.Router();
 
-router.use(protect); // All routes are protected
+// Called by D-ID, authenticated with the shared webhook token instead
+router.post('/did/webhook', handleDIDWebhook);
+
+router.use(protect); // All other routes are protected
 
 router.get('/voices', getAvailableVoices);
 router.get('/did/health', checkDIDHealth);
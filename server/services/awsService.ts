@@ -1,23 +1,52 @@
-import { S3Client, PutObjectCommand, DeleteObjectCommand, ListObjectsV2Command } from '@aws-sdk/client-s3';
+import { S3Client, PutObjectCommand, DeleteObjectCommand, HeadObjectCommand, ListObjectsV2Command } from '@aws-sdk/client-s3';
+import { Upload } from '@aws-sdk/lib-storage';
 import { getSignedUrl } from '@aws-sdk/s3-request-presigner';
 import { GetObjectCommand } from '@aws-sdk/client-s3';
 import multer from 'multer';
 import multerS3 from 'multer-s3';
+import { Readable } from 'stream';
+import logger from '../utils/logger';
+import { MAX_UPLOAD_SIZE, isAllowedMimeType } from '../utils/uploadRules';
+
+const region = process.env.AWS_REGION || 'ap-south-1';
+// Route uploads through S3 Transfer Acceleration edges when the server runs
+// far from the bucket region (must also be enabled on the bucket)
+const useAccelerateEndpoint = process.env.AWS_S3_ACCELERATE === 'true';
 
 // Configure AWS SDK v3
 const s3Client = new S3Client({
-  region: process.env.AWS_REGION || 'ap-south-1',
+  region,
+  useAccelerateEndpoint,
   credentials: {
     accessKeyId: process.env.AWS_ACCESS_KEY_ID!,
     secretAccessKey: process.env.AWS_SECRET_ACCESS_KEY!
   }
 });
 
+// Multipart settings for uploads. Files larger than one part are split and
+// uploaded with several parts in flight instead of a single PUT.
+const UPLOAD_PART_SIZE = 8 * 1024 * 1024; // 8MB
+const UPLOAD_QUEUE_SIZE = 10;
+
+// Every object key is unique (timestamped or content-hashed) and never
+// rewritten, so browsers and CloudFront can cache objects indefinitely
+export const UPLOAD_CACHE_CONTROL = 'public, max-age=31536000, immutable';
+
 class AWSService {
   private bucketName: string;
+  private publicBaseUrl: string;
 
   constructor() {
     this.bucketName = process.env.AWS_BUCKET_NAME || 'lexora-assets';
+    // Objects are made readable by the bucket policy rather than per-object
+    // ACLs; serve them through CloudFront when a distribution is configured
+    this.publicBaseUrl = process.env.AWS_CLOUDFRONT_URL?.replace(/\/+$/, '')
+      || `https://${this.bucketName}.s3.${region}.amazonaws.com`;
+
+    const endpoint = useAccelerateEndpoint
+      ? `${this.bucketName}.s3-accelerate.amazonaws.com`
+      : `${this.bucketName}.s3.${region}.amazonaws.com`;
+    logger.info('S3 uploads go to %s', endpoint);
   }
 
   // Create multer upload middleware for S3
@@ -26,6 +55,7 @@ class AWSService {
       storage: multerS3({
         s3: s3Client as any,
         bucket: this.bucketName,
+        cacheControl: UPLOAD_CACHE_CONTROL,
         metadata: (req, file, cb) => {
           cb(null, { fieldName: file.fieldname });
         },
@@ -36,23 +66,10 @@ class AWSService {
         }
       }),
       limits: {
-        fileSize: 50 * 1024 * 1024 // 50MB limit
+        fileSize: MAX_UPLOAD_SIZE
       },
       fileFilter: (req, file, cb) => {
-        // Allow images, videos, and audio files
-        const allowedMimes = [
-          'image/jpeg',
-          'image/png',
-          'image/gif',
-          'video/mp4',
-          'video/avi',
-          'video/mov',
-          'audio/mp3',
-          'audio/wav',
-          'audio/mpeg'
-        ];
-        
-        if (allowedMimes.includes(file.mimetype)) {
+        if (isAllowedMimeType(file.mimetype)) {
           cb(null, true);
         } else {
           cb(new Error('Invalid file type'));
@@ -61,25 +78,71 @@ class AWSService {
     });
   }
 
-  // Upload file directly to S3
-  async uploadFile(file: Buffer, fileName: string, mimeType: string, folder: string = 'uploads'): Promise<string> {
+  // Upload file directly to S3. Streams are uploaded part by part as they
+  // are read, so the whole file never has to be buffered in memory.
+  async uploadFile(
+    file: Buffer | Readable,
+    fileName: string,
+    mimeType: string,
+    folder: string = 'uploads'
+  ): Promise<string> {
     try {
-      const command = new PutObjectCommand({
-        Bucket: this.bucketName,
-        Key: `${folder}/${fileName}`,
-        Body: file,
-        ContentType: mimeType,
-        ACL: 'public-read'
+      const upload = new Upload({
+        client: s3Client,
+        params: {
+          Bucket: this.bucketName,
+          Key: `${folder}/${fileName}`,
+          Body: file,
+          ContentType: mimeType,
+          CacheControl: UPLOAD_CACHE_CONTROL
+        },
+        partSize: UPLOAD_PART_SIZE,
+        queueSize: UPLOAD_QUEUE_SIZE
       });
 
-      await s3Client.send(command);
-      return `https://${this.bucketName}.s3.${process.env.AWS_REGION || 'ap-south-1'}.amazonaws.com/${folder}/${fileName}`;
+      await upload.done();
+      return this.getFileUrl(`${folder}/${fileName}`);
     } catch (error) {
       console.error('S3 Upload Error:', error);
       throw new Error('Failed to upload file to S3');
     }
   }
 
+  // Get the public URL of a file
+  getFileUrl(fileKey: string): string {
+    return `${this.publicBaseUrl}/${fileKey}`;
+  }
+
+  // Get the object key of a file from its public URL
+  getFileKey(fileUrl: string): string {
+    if (fileUrl.startsWith(`${this.publicBaseUrl}/`)) {
+      return fileUrl.slice(this.publicBaseUrl.length + 1);
+    }
+    return new URL(fileUrl).pathname.slice(1);
+  }
+
+  // Get a file's size and content type, or null if the file does not exist
+  async headFile(fileKey: string): Promise<{ size: number; contentType?: string } | null> {
+    try {
+      const command = new HeadObjectCommand({
+        Bucket: this.bucketName,
+        Key: fileKey
+      });
+
+      const result = await s3Client.send(command);
+      return {
+        size: result.ContentLength || 0,
+        contentType: result.ContentType
+      };
+    } catch (error: any) {
+      if (error.name === 'NotFound' || error.$metadata?.httpStatusCode === 404) {
+        return null;
+      }
+      console.error('S3 Head Error:', error);
+      throw new Error('Failed to read file metadata from S3');
+    }
+  }
+
   // Delete file from S3
   async deleteFile(fileKey: string): Promise<void> {
     try {
@@ -105,6 +168,25 @@ class AWSService {
     return await getSignedUrl(s3Client, command, { expiresIn });
   }
 
+  // Get a presigned URL the client can PUT a file to directly, so the
+  // upload does not have to be relayed through this server
+  async getUploadUrl(fileKey: string, mimeType: string, fileSize: number, expiresIn: number = 3600): Promise<string> {
+    const command = new PutObjectCommand({
+      Bucket: this.bucketName,
+      Key: fileKey,
+      ContentType: mimeType,
+      // Signed below, so S3 rejects a PUT of any other type or size
+      ContentLength: fileSize,
+      // Not signable; stored as the uploader sends it
+      CacheControl: UPLOAD_CACHE_CONTROL
+    });
+
+    return await getSignedUrl(s3Client, command, {
+      expiresIn,
+      signableHeaders: new Set(['content-type', 'content-length'])
+    });
+  }
+
   // List files in a folder
   async listFiles(folder: string): Promise<any[]> {
     try {
@@ -1,4 +1,5 @@
-import axios from 'axios';
+import { AxiosInstance } from 'axios';
+import { createHttpClient } from '../utils/httpClient';
 
 const GROQ_API_URL = 'https://api.groq.com/openai/v1/chat/completions';
 
@@ -44,9 +45,16 @@ interface ScriptParams {
 
 class GroqService {
   private apiKey: string;
+  private client: AxiosInstance;
 
   constructor() {
     this.apiKey = process.env.GROQ_API_KEY || '';
+    this.client = createHttpClient({
+      headers: {
+        'Authorization': `Bearer ${this.apiKey}`,
+        'Content-Type': 'application/json'
+      }
+    });
     if (!this.apiKey) {
       console.warn('GROQ_API_KEY not found in environment variables');
     }
@@ -121,7 +129,7 @@ Make sure:
 - Practical exercises are included
 - Real-world applications are emphasized`;
 
-      const response = await axios.post<GroqResponse>(
+      const response = await this.client.post<GroqResponse>(
         GROQ_API_URL,
         {
           model: 'llama3-8b-8192',
@@ -137,12 +145,6 @@ Make sure:
           ],
           temperature: 0.7,
           max_tokens: 3000
-        },
-        {
-          headers: {
-            'Authorization': `Bearer ${this.apiKey}`,
-            'Content-Type': 'application/json'
-          }
         }
       );
 
@@ -199,7 +201,7 @@ Create detailed lesson content including:
 Make it engaging, practical, and appropriate for ${params.difficulty} level learners.
 Length: 800-1200 words for a 15-20 minute lesson.`;
 
-      const response = await axios.post<GroqResponse>(
+      const response = await this.client.post<GroqResponse>(
         GROQ_API_URL,
         {
           model: 'llama3-8b-8192',
@@ -215,12 +217,6 @@ Length: 800-1200 words for a 15-20 minute lesson.`;
           ],
           temperature: 0.7,
           max_tokens: 2000
-        },
-        {
-          headers: {
-            'Authorization': `Bearer ${this.apiKey}`,
-            'Content-Type': 'application/json'
-          }
         }
       );
 
@@ -261,7 +257,7 @@ Guidelines for ${params.tone} ${params.style} narration:
 
 Format as a natural speech script with appropriate pacing for video narration.`;
 
-      const response = await axios.post<GroqResponse>(
+      const response = await this.client.post<GroqResponse>(
         GROQ_API_URL,
         {
           model: 'llama3-8b-8192',
@@ -277,12 +273,6 @@ Format as a natural speech script with appropriate pacing for video narration.`;
           ],
           temperature: 0.6,
           max_tokens: 1500
-        },
-        {
-          headers: {
-            'Authorization': `Bearer ${this.apiKey}`,
-            'Content-Type': 'application/json'
-          }
         }
       );
 
@@ -350,7 +340,7 @@ Format the response as a JSON object with the following structure:
   "projects": ["project1", "project2"]
 }`;
 
-      const response = await axios.post<GroqResponse>(
+      const response = await this.client.post<GroqResponse>(
         GROQ_API_URL,
         {
           model: 'llama3-8b-8192',
@@ -366,12 +356,6 @@ Format the response as a JSON object with the following structure:
           ],
           temperature: 0.7,
           max_tokens: 2000
-        },
-        {
-          headers: {
-            'Authorization': `Bearer ${this.apiKey}`,
-            'Content-Type': 'application/json'
-          }
         }
       );
 
@@ -416,7 +400,7 @@ Please provide:
 
 Make it engaging, practical, and easy to understand.`;
 
-      const response = await axios.post<GroqResponse>(
+      const response = await this.client.post<GroqResponse>(
         GROQ_API_URL,
         {
           model: 'llama3-8b-8192',
@@ -432,12 +416,6 @@ Make it engaging, practical, and easy to understand.`;
           ],
           temperature: 0.7,
           max_tokens: 1500
-        },
-        {
-          headers: {
-            'Authorization': `Bearer ${this.apiKey}`,
-            'Content-Type': 'application/json'
-          }
         }
       );
 
@@ -464,7 +442,7 @@ Guidelines:
 
 Format as a script with natural speech patterns.`;
 
-      const response = await axios.post<GroqResponse>(
+      const response = await this.client.post<GroqResponse>(
         GROQ_API_URL,
         {
           model: 'llama3-8b-8192',
@@ -480,12 +458,6 @@ Format as a script with natural speech patterns.`;
           ],
           temperature: 0.6,
           max_tokens: 1200
-        },
-        {
-          headers: {
-            'Authorization': `Bearer ${this.apiKey}`,
-            'Content-Type': 'application/json'
-          }
         }
       );
 
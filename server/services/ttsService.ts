@@ -1,14 +1,61 @@
-import axios from 'axios';
+import { AxiosInstance } from 'axios';
+import crypto from 'crypto';
 import fs from 'fs';
 import path from 'path';
+import { Readable, pipeline } from 'stream';
 import { promisify } from 'util';
 import FormData from 'form-data';
 import awsService from './awsService';
+import Asset from '../models/Asset';
 import { hasApiKey, isDevelopment } from '../utils/devConfig';
+import { createHttpClient } from '../utils/httpClient';
+import logger from '../utils/logger';
+import { ByteCounter, SPEECH_OUTPUT_FORMAT, getMp3Duration } from '../utils/audio';
 
-const writeFile = promisify(fs.writeFile);
 const unlink = promisify(fs.unlink);
 
+// ElevenLabs voice IDs are typically 20-character alphanumeric strings
+const ELEVENLABS_VOICE_ID_PATTERN = /^[a-zA-Z0-9]{20}$/;
+const MONGO_OBJECT_ID_PATTERN = /^[0-9a-fA-F]{24}$/;
+
+const DEFAULT_VOICE_ID = 'pNInz6obpgDQGcFmaJgB'; // Default Adam voice
+const DEFAULT_VOICE_SETTINGS = {
+  stability: 0.5,
+  similarityBoost: 0.8,
+  style: 0.0,
+  useSpeakerBoost: true
+};
+
+// A minimal MP3 buffer (silent audio) for development mode, built once
+const MOCK_MP3_BUFFER = Buffer.from([
+  0x49, 0x44, 0x33, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, // ID3 header
+  0xFF, 0xFB, 0x90, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, // MP3 frame header
+  0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
+]);
+
+// The voice list rarely changes; clone and delete invalidate it early
+const VOICES_CACHE_TTL_MS = 5 * 60 * 1000;
+
+const DEFAULT_VOICES: Voice[] = [
+  { id: 'pNInz6obpgDQGcFmaJgB', name: 'Adam', category: 'premade', description: 'Deep, authoritative male voice' },
+  { id: 'EXAVITQu4vr4xnSDxMaL', name: 'Bella', category: 'premade', description: 'Warm, friendly female voice' },
+  { id: 'ErXwobaYiN019PkySvjV', name: 'Antoni', category: 'premade', description: 'Smooth, professional male voice' },
+  { id: 'MF3mGyEYCl7XYWbV9V6O', name: 'Elli', category: 'premade', description: 'Young, energetic female voice' },
+  { id: 'TxGEqnHWrfWFTfGW9XjX', name: 'Josh', category: 'premade', description: 'Casual, conversational male voice' }
+];
+
+// Generated speech is stored under a content hash so identical
+// script + voice requests reuse the existing file
+const SPEECH_CACHE_FOLDER = 'generated/audio';
+// Recent cache hits are remembered in process so repeat renders skip the S3 HEAD
+const SPEECH_MEMO_SIZE = 500;
+
+// Long scripts are synthesized as sentence-aligned chunks in parallel. The
+// output is constant-bitrate MP3, so the parts are joined byte for byte.
+const SPEECH_CHUNK_CHARS = 2500;
+const SPEECH_CHUNK_CONCURRENCY = 3;
+const SENTENCE_BOUNDARY_PATTERN = /(?<=[.!?])\s+/;
+
 interface TTSOptions {
   text: string;
   voice?: string;
@@ -17,6 +64,9 @@ interface TTSOptions {
   similarityBoost?: number;
   style?: number;
   useSpeakerBoost?: boolean;
+  // Neighbouring text keeps intonation continuous across chunk boundaries
+  previousText?: string;
+  nextText?: string;
 }
 
 interface TTSResult {
@@ -26,6 +76,15 @@ interface TTSResult {
   audioUrl?: string;
 }
 
+interface Voice {
+  id: string;
+  name: string;
+  category: string;
+  description?: string;
+  preview_url?: string;
+  labels?: Record<string, string>;
+}
+
 interface VoiceCloneOptions {
   name: string;
   description?: string;
@@ -36,16 +95,27 @@ interface VoiceCloneOptions {
 class TTSService {
   private tempDir: string;
   private apiKey: string;
+  private hasKey: boolean;
   private baseUrl: string;
+  private client: AxiosInstance;
+  private voicesCache?: { voices: Voice[]; fetchedAt: number };
+  private speechMemo = new Map<string, { audioUrl: string; duration: number }>();
 
   constructor() {
     this.tempDir = path.join(process.cwd(), 'temp');
     this.apiKey = process.env.ELEVENLABS_API_KEY || '';
+    this.hasKey = hasApiKey('ELEVENLABS_API_KEY');
     this.baseUrl = 'https://api.elevenlabs.io/v1';
+    this.client = createHttpClient({
+      baseURL: this.baseUrl,
+      headers: {
+        'xi-api-key': this.apiKey
+      }
+    });
     this.ensureTempDir();
 
     if (!this.apiKey) {
-      console.warn('ELEVENLABS_API_KEY not found in environment variables');
+      logger.warn('ELEVENLABS_API_KEY not found in environment variables');
     }
   }
 
@@ -60,70 +130,34 @@ class TTSService {
    */
   async generateSpeech(options: TTSOptions): Promise<TTSResult> {
     try {
-      const {
-        text,
-        voiceId = 'pNInz6obpgDQGcFmaJgB', // Default Adam voice
-        stability = 0.5,
-        similarityBoost = 0.8,
-        style = 0.0,
-        useSpeakerBoost = true
-      } = options;
+      const { text } = options;
 
       // Check if API key is available
-      if (!hasApiKey('ELEVENLABS_API_KEY')) {
+      if (!this.hasKey) {
         if (isDevelopment) {
-          console.warn('[DEV MODE] ElevenLabs API key not configured, generating mock audio');
+          logger.warn('[DEV MODE] ElevenLabs API key not configured, generating mock audio');
           return this.generateMockAudio(text);
         }
         throw new Error('ElevenLabs API key not configured');
       }
 
-      // Resolve voice ID - if it's a MongoDB ObjectId, map it to a real ElevenLabs voice ID
-      const resolvedVoiceId = await this.resolveVoiceId(voiceId);
-
-      console.log(`Generating speech with ElevenLabs for voice: ${resolvedVoiceId}`);
-
-      const response = await axios.post(
-        `${this.baseUrl}/text-to-speech/${resolvedVoiceId}`,
-        {
-          text,
-          model_id: 'eleven_multilingual_v2',
-          voice_settings: {
-            stability,
-            similarity_boost: similarityBoost,
-            style,
-            use_speaker_boost: useSpeakerBoost
-          }
-        },
-        {
-          headers: {
-            'Accept': 'audio/mpeg',
-            'Content-Type': 'application/json',
-            'xi-api-key': this.apiKey
-          },
-          responseType: 'arraybuffer'
-        }
-      );
-
+      const response = await this.requestSpeech(options, 'arraybuffer');
       const audioBuffer = Buffer.from(response.data);
-      
-      // Estimate duration based on text length (rough calculation: ~150 words per minute)
-      const wordCount = text.split(' ').length;
-      const estimatedDuration = Math.ceil((wordCount / 150) * 60);
+      const duration = getMp3Duration(audioBuffer.length);
 
-      console.log(`ElevenLabs TTS completed. Audio size: ${audioBuffer.length} bytes, Duration: ${estimatedDuration}s`);
+      logger.info('ElevenLabs TTS completed. Audio size: %s bytes, Duration: %ss', audioBuffer.length, duration);
 
       return {
         audioBuffer,
-        duration: estimatedDuration,
+        duration,
         format: 'mp3'
       };
     } catch (error: any) {
-      console.error('ElevenLabs TTS Error:', error.response?.data || error.message);
+      logger.error('ElevenLabs TTS Error:', error.response?.data || error.message);
       
       // In development mode, return mock audio instead of failing
       if (isDevelopment) {
-        console.warn('[DEV MODE] ElevenLabs API failed, generating mock audio');
+        logger.warn('[DEV MODE] ElevenLabs API failed, generating mock audio');
         return this.generateMockAudio(options.text);
       }
       
@@ -131,6 +165,88 @@ class TTSService {
     }
   }
 
+  /**
+   * Stream speech from ElevenLabs as it is synthesized
+   */
+  async streamSpeech(options: TTSOptions): Promise<Readable> {
+    if (!this.hasKey) {
+      throw new Error('ElevenLabs API key not configured');
+    }
+
+    try {
+      const response = await this.requestSpeech(options, 'stream');
+      return response.data;
+    } catch (error: any) {
+      // The error body is a stream here, so only the status is useful
+      logger.error('ElevenLabs TTS Stream Error:', error.response?.status || error.message);
+      throw new Error(`Failed to stream speech: ${error.message}`);
+    }
+  }
+
+  /**
+   * Send a text-to-speech request to ElevenLabs
+   */
+  private async requestSpeech(options: TTSOptions, responseType: 'arraybuffer' | 'stream', signal?: AbortSignal) {
+    const {
+      text,
+      voiceId = DEFAULT_VOICE_ID,
+      stability = DEFAULT_VOICE_SETTINGS.stability,
+      similarityBoost = DEFAULT_VOICE_SETTINGS.similarityBoost,
+      style = DEFAULT_VOICE_SETTINGS.style,
+      useSpeakerBoost = DEFAULT_VOICE_SETTINGS.useSpeakerBoost,
+      previousText,
+      nextText
+    } = options;
+
+    // Resolve voice ID - if it's a MongoDB ObjectId, map it to a real ElevenLabs voice ID
+    const resolvedVoiceId = await this.resolveVoiceId(voiceId);
+
+    logger.debug('Generating speech with ElevenLabs for voice: %s', resolvedVoiceId);
+
+    const endpoint = responseType === 'stream'
+      ? `/text-to-speech/${resolvedVoiceId}/stream`
+      : `/text-to-speech/${resolvedVoiceId}`;
+
+    return await this.client.post(
+      endpoint,
+      {
+        text,
+        model_id: 'eleven_multilingual_v2',
+        voice_settings: {
+          stability,
+          similarity_boost: similarityBoost,
+          style,
+          use_speaker_boost: useSpeakerBoost
+        },
+        previous_text: previousText,
+        next_text: nextText
+      },
+      {
+        headers: {
+          'Accept': 'audio/mpeg',
+          // MP3 is already compressed; asking for gzip only adds an inflate
+          // pass on every chunk
+          'Accept-Encoding': 'identity',
+          'Content-Type': 'application/json'
+        },
+        params: {
+          output_format: SPEECH_OUTPUT_FORMAT
+        },
+        responseType,
+        signal
+      }
+    );
+  }
+
+  /**
+   * Estimate speech duration from text length (~150 words per minute)
+   * Only used for mock audio, which has no real length
+   */
+  private estimateDuration(text: string): number {
+    const wordCount = text.split(' ').length;
+    return Math.ceil((wordCount / 150) * 60);
+  }
+
   /**
    * Clone a voice from an audio sample
    */
@@ -138,42 +254,31 @@ class TTSService {
     try {
       const { name, description, audioFile, labels } = options;
 
-      console.log(`Cloning voice with name: ${name}`);
+      logger.info('Cloning voice with name: %s', name);
 
       const formData = new FormData();
       formData.append('name', name);
       if (description) formData.append('description', description);
       if (labels) formData.append('labels', JSON.stringify(labels));
 
-      // Create a temporary file for the audio
-      const tempFileName = `voice_clone_${Date.now()}.mp3`;
-      const tempFilePath = path.join(this.tempDir, tempFileName);
-      await writeFile(tempFilePath, audioFile);
-
-      // Add the file to form data
-      const fileStream = fs.createReadStream(tempFilePath);
-      formData.append('files', fileStream);
-
-      const response = await axios.post(
-        `${this.baseUrl}/voices/add`,
-        formData,
-        {
-          headers: {
-            'xi-api-key': this.apiKey,
-            ...formData.getHeaders()
-          }
-        }
-      );
+      // Append the sample straight from memory rather than round-tripping
+      // it through a temporary file
+      formData.append('files', audioFile, {
+        filename: `voice_clone_${Date.now()}.mp3`,
+        contentType: 'audio/mpeg'
+      });
 
-      // Clean up temp file
-      await unlink(tempFilePath).catch(() => {});
+      const response = await this.client.post('/voices/add', formData, {
+        headers: formData.getHeaders()
+      });
 
       const voiceId = response.data.voice_id;
-      console.log(`Voice cloned successfully with ID: ${voiceId}`);
+      logger.info('Voice cloned successfully with ID: %s', voiceId);
+      this.voicesCache = undefined;
 
       return voiceId;
     } catch (error: any) {
-      console.error('Voice cloning error:', error.response?.data || error.message);
+      logger.error('Voice cloning error:', error.response?.data || error.message);
       throw new Error(`Failed to clone voice: ${error.response?.data?.detail?.message || error.message}`);
     }
   }
@@ -181,15 +286,15 @@ class TTSService {
   /**
    * Get available voices from ElevenLabs
    */
-  async getAvailableVoices(): Promise<Array<{ id: string; name: string; category: string; description?: string }>> {
+  async getAvailableVoices(): Promise<Voice[]> {
+    if (this.voicesCache && Date.now() - this.voicesCache.fetchedAt < VOICES_CACHE_TTL_MS) {
+      return this.voicesCache.voices;
+    }
+
     try {
-      const response = await axios.get(`${this.baseUrl}/voices`, {
-        headers: {
-          'xi-api-key': this.apiKey
-        }
-      });
+      const response = await this.client.get('/voices');
 
-      return response.data.voices.map((voice: any) => ({
+      const voices: Voice[] = response.data.voices.map((voice: any) => ({
         id: voice.voice_id,
         name: voice.name,
         category: voice.category || 'generated',
@@ -197,17 +302,13 @@ class TTSService {
         preview_url: voice.preview_url,
         labels: voice.labels
       }));
+      this.voicesCache = { voices, fetchedAt: Date.now() };
+      return voices;
     } catch (error: any) {
-      console.error('Failed to get ElevenLabs voices:', error.response?.data || error.message);
+      logger.error('Failed to get ElevenLabs voices:', error.response?.data || error.message);
       
-      // Return default voices if API call fails
-      return [
-        { id: 'pNInz6obpgDQGcFmaJgB', name: 'Adam', category: 'premade', description: 'Deep, authoritative male voice' },
-        { id: 'EXAVITQu4vr4xnSDxMaL', name: 'Bella', category: 'premade', description: 'Warm, friendly female voice' },
-        { id: 'ErXwobaYiN019PkySvjV', name: 'Antoni', category: 'premade', description: 'Smooth, professional male voice' },
-        { id: 'MF3mGyEYCl7XYWbV9V6O', name: 'Elli', category: 'premade', description: 'Young, energetic female voice' },
-        { id: 'TxGEqnHWrfWFTfGW9XjX', name: 'Josh', category: 'premade', description: 'Casual, conversational male voice' }
-      ];
+      // Fall back to the last good list, then to the default voices
+      return this.voicesCache?.voices || DEFAULT_VOICES;
     }
   }
 
@@ -220,40 +321,232 @@ class TTSService {
     options: Partial<TTSOptions> = {}
   ): Promise<{ audioUrl: string; duration: number }> {
     try {
-      const ttsResult = await this.generateSpeech({ text, ...options });
-      
+      const cacheFileName = `tts_${this.getSpeechCacheKey(text, options)}.mp3`;
+      const cached = await this.findCachedSpeech(cacheFileName);
+      if (cached) {
+        logger.debug('Reusing cached speech: %s', cacheFileName);
+        return cached;
+      }
+
+      if (this.hasKey && text.length > SPEECH_CHUNK_CHARS) {
+        try {
+          const audioBuffer = await this.synthesizeInChunks(text, options);
+          const audioUrl = await awsService.uploadFile(
+            audioBuffer,
+            cacheFileName,
+            'audio/mp3',
+            SPEECH_CACHE_FOLDER
+          );
+
+          const speech = { audioUrl, duration: getMp3Duration(audioBuffer.length) };
+          this.rememberSpeech(`${SPEECH_CACHE_FOLDER}/${cacheFileName}`, speech);
+          return speech;
+        } catch (error) {
+          if (!isDevelopment) {
+            throw error;
+          }
+          logger.warn('[DEV MODE] ElevenLabs chunked synthesis failed, generating mock audio');
+        }
+      } else if (this.hasKey) {
+        try {
+          // Pipe the audio from ElevenLabs into S3 as it is synthesized
+          const audioStream = await this.streamSpeech({ text, ...options });
+          // Count bytes on the way through to get the real duration; stream
+          // errors reach the upload through the counter
+          const counter = new ByteCounter();
+          pipeline(audioStream, counter, () => {});
+
+          const audioUrl = await awsService.uploadFile(
+            counter,
+            cacheFileName,
+            'audio/mp3',
+            SPEECH_CACHE_FOLDER
+          );
+
+          const speech = { audioUrl, duration: getMp3Duration(counter.bytes) };
+          this.rememberSpeech(`${SPEECH_CACHE_FOLDER}/${cacheFileName}`, speech);
+          return speech;
+        } catch (error) {
+          // In development mode, fall back to mock audio instead of failing
+          if (!isDevelopment) {
+            throw error;
+          }
+          logger.warn('[DEV MODE] ElevenLabs streaming failed, generating mock audio');
+        }
+      } else if (isDevelopment) {
+        logger.warn('[DEV MODE] ElevenLabs API key not configured, generating mock audio');
+      } else {
+        throw new Error('ElevenLabs API key not configured');
+      }
+
+      // Mock audio must never be stored under the cache key
+      const mockAudio = this.generateMockAudio(text);
       const audioUrl = await awsService.uploadFile(
-        ttsResult.audioBuffer,
+        mockAudio.audioBuffer,
         `${fileName}.mp3`,
         'audio/mp3',
-        'generated/audio'
+        SPEECH_CACHE_FOLDER
       );
 
       return {
         audioUrl,
-        duration: ttsResult.duration
+        duration: mockAudio.duration
       };
     } catch (error) {
-      console.error('TTS Upload Error:', error);
+      logger.error('TTS Upload Error:', error);
       throw new Error('Failed to generate and upload speech');
     }
   }
 
+  /**
+   * Synthesize a long script as parallel sentence-aligned chunks
+   */
+  private async synthesizeInChunks(text: string, options: Partial<TTSOptions>): Promise<Buffer> {
+    const chunks = this.splitIntoChunks(text);
+    // Resolve once rather than per chunk
+    const voiceId = await this.resolveVoiceId(options.voiceId || DEFAULT_VOICE_ID);
+    const parts: Buffer[] = new Array(chunks.length);
+    let nextIndex = 0;
+    // One failed chunk fails the whole script, so stop the other workers
+    // (and their in-flight requests) rather than pay for audio we discard
+    const abort = new AbortController();
+
+    logger.debug('Synthesizing %s characters as %s chunks', text.length, chunks.length);
+
+    const worker = async () => {
+      while (!abort.signal.aborted && nextIndex < chunks.length) {
+        const index = nextIndex++;
+        try {
+          const response = await this.requestSpeech(
+            {
+              ...options,
+              voiceId,
+              text: chunks[index],
+              previousText: chunks[index - 1],
+              nextText: chunks[index + 1]
+            },
+            'arraybuffer',
+            abort.signal
+          );
+          parts[index] = Buffer.from(response.data);
+        } catch (error) {
+          abort.abort();
+          throw error;
+        }
+      }
+    };
+
+    await Promise.all(
+      Array.from({ length: Math.min(SPEECH_CHUNK_CONCURRENCY, chunks.length) }, worker)
+    );
+
+    return Buffer.concat(parts);
+  }
+
+  /**
+   * Split text on sentence boundaries into chunks of at most
+   * SPEECH_CHUNK_CHARS (a single longer sentence becomes its own chunk)
+   */
+  private splitIntoChunks(text: string): string[] {
+    const chunks: string[] = [];
+    let current = '';
+
+    for (const sentence of text.split(SENTENCE_BOUNDARY_PATTERN)) {
+      if (current && current.length + sentence.length + 1 > SPEECH_CHUNK_CHARS) {
+        chunks.push(current);
+        current = sentence;
+      } else {
+        current = current ? `${current} ${sentence}` : sentence;
+      }
+    }
+
+    if (current) {
+      chunks.push(current);
+    }
+
+    return chunks;
+  }
+
+  /**
+   * Build the content hash identifying a script + voice combination
+   */
+  private getSpeechCacheKey(text: string, options: Partial<TTSOptions>): string {
+    const settings = [
+      options.voiceId || DEFAULT_VOICE_ID,
+      options.stability ?? DEFAULT_VOICE_SETTINGS.stability,
+      options.similarityBoost ?? DEFAULT_VOICE_SETTINGS.similarityBoost,
+      options.style ?? DEFAULT_VOICE_SETTINGS.style,
+      options.useSpeakerBoost ?? DEFAULT_VOICE_SETTINGS.useSpeakerBoost,
+      SPEECH_OUTPUT_FORMAT
+    ];
+
+    // The settings JSON is self-delimiting, so the script can be fed to the
+    // hash as is rather than escaped into one combined string first
+    return crypto
+      .createHash('sha256')
+      .update(JSON.stringify(settings))
+      .update(text)
+      .digest('hex');
+  }
+
+  /**
+   * Look up previously generated speech in S3
+   */
+  private async findCachedSpeech(cacheFileName: string): Promise<{ audioUrl: string; duration: number } | null> {
+    const fileKey = `${SPEECH_CACHE_FOLDER}/${cacheFileName}`;
+
+    const memoized = this.speechMemo.get(fileKey);
+    if (memoized) {
+      // Re-insert to keep the most recently used entries at the end
+      this.speechMemo.delete(fileKey);
+      this.speechMemo.set(fileKey, memoized);
+      return memoized;
+    }
+
+    try {
+      const file = await awsService.headFile(fileKey);
+      if (!file) {
+        return null;
+      }
+
+      const cached = {
+        audioUrl: awsService.getFileUrl(fileKey),
+        duration: getMp3Duration(file.size)
+      };
+      this.rememberSpeech(fileKey, cached);
+      return cached;
+    } catch (error) {
+      // A failed lookup only costs us the cache hit
+      logger.warn('TTS cache lookup failed:', error);
+      return null;
+    }
+  }
+
+  /**
+   * Remember a cache hit, evicting the least recently used entry when full
+   */
+  private rememberSpeech(fileKey: string, speech: { audioUrl: string; duration: number }) {
+    this.speechMemo.set(fileKey, speech);
+    if (this.speechMemo.size > SPEECH_MEMO_SIZE) {
+      const oldestKey = this.speechMemo.keys().next().value;
+      if (oldestKey !== undefined) {
+        this.speechMemo.delete(oldestKey);
+      }
+    }
+  }
+
   /**
    * Delete a cloned voice
    */
   async deleteVoice(voiceId: string): Promise<boolean> {
     try {
-      await axios.delete(`${this.baseUrl}/voices/${voiceId}`, {
-        headers: {
-          'xi-api-key': this.apiKey
-        }
-      });
+      await this.client.delete(`/voices/${voiceId}`);
 
-      console.log(`Voice ${voiceId} deleted successfully`);
+      logger.info('Voice %s deleted successfully', voiceId);
+      this.voicesCache = undefined;
       return true;
     } catch (error: any) {
-      console.error('Failed to delete voice:', error.response?.data || error.message);
+      logger.error('Failed to delete voice:', error.response?.data || error.message);
       return false;
     }
   }
@@ -263,15 +556,11 @@ class TTSService {
    */
   async getVoiceDetails(voiceId: string): Promise<any> {
     try {
-      const response = await axios.get(`${this.baseUrl}/voices/${voiceId}`, {
-        headers: {
-          'xi-api-key': this.apiKey
-        }
-      });
+      const response = await this.client.get(`/voices/${voiceId}`);
 
       return response.data;
     } catch (error: any) {
-      console.error('Failed to get voice details:', error.response?.data || error.message);
+      logger.error('Failed to get voice details:', error.response?.data || error.message);
       throw new Error(`Failed to get voice details: ${error.message}`);
     }
   }
@@ -284,7 +573,7 @@ class TTSService {
       const testText = "Hello, this is a test of the ElevenLabs text-to-speech system.";
       const result = await this.generateSpeech({ text: testText });
       
-      console.log('ElevenLabs TTS Test successful:', {
+      logger.info('ElevenLabs TTS Test successful:', {
         audioSize: result.audioBuffer.length,
         duration: result.duration,
         format: result.format
@@ -292,7 +581,7 @@ class TTSService {
       
       return true;
     } catch (error) {
-      console.error('ElevenLabs TTS Test failed:', error);
+      logger.error('ElevenLabs TTS Test failed:', error);
       return false;
     }
   }
@@ -309,57 +598,46 @@ class TTSService {
     // If it's a MongoDB ObjectId, try to resolve it from the database
     if (this.isMongoObjectId(voiceId)) {
       try {
-        const { default: Asset } = await import('../models/Asset');
-        const asset = await Asset.findById(voiceId);
+        const asset = await Asset.findById(voiceId).select('elevenLabsVoiceId').lean();
         
         if (asset && asset.elevenLabsVoiceId) {
-          console.log(`Resolved MongoDB voice ID ${voiceId} to ElevenLabs voice ID ${asset.elevenLabsVoiceId}`);
+          logger.debug('Resolved MongoDB voice ID %s to ElevenLabs voice ID %s', voiceId, asset.elevenLabsVoiceId);
           return asset.elevenLabsVoiceId;
         }
       } catch (error) {
-        console.warn(`Failed to resolve voice ID ${voiceId} from database:`, error);
+        logger.warn('Failed to resolve voice ID %s from database:', voiceId, error);
       }
     }
 
     // Fallback to default voice
-    console.warn(`Using default voice for unresolved voice ID: ${voiceId}`);
-    return 'pNInz6obpgDQGcFmaJgB'; // Default Adam voice
+    logger.warn('Using default voice for unresolved voice ID: %s', voiceId);
+    return DEFAULT_VOICE_ID;
   }
 
   /**
    * Check if a string is a valid ElevenLabs voice ID format
    */
   private isValidElevenLabsVoiceId(voiceId: string): boolean {
-    // ElevenLabs voice IDs are typically 20-character alphanumeric strings
-    return /^[a-zA-Z0-9]{20}$/.test(voiceId);
+    return ELEVENLABS_VOICE_ID_PATTERN.test(voiceId);
   }
 
   /**
    * Check if a string is a MongoDB ObjectId format
    */
   private isMongoObjectId(id: string): boolean {
-    return /^[0-9a-fA-F]{24}$/.test(id);
+    return MONGO_OBJECT_ID_PATTERN.test(id);
   }
 
   /**
    * Generate mock audio for development mode
    */
   private generateMockAudio(text: string): TTSResult {
-    // Create a minimal MP3 buffer (silent audio)
-    const mockMp3Buffer = Buffer.from([
-      0x49, 0x44, 0x33, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, // ID3 header
-      0xFF, 0xFB, 0x90, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, // MP3 frame header
-      0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-    ]);
+    const estimatedDuration = this.estimateDuration(text);
     
-    // Estimate duration based on text length
-    const wordCount = text.split(' ').length;
-    const estimatedDuration = Math.ceil((wordCount / 150) * 60);
-    
-    console.log(`[DEV MODE] Generated mock audio for text: "${text.substring(0, 50)}..."`);
+    logger.info('[DEV MODE] Generated mock audio for text: "%s..."', text.substring(0, 50));
     
     return {
-      audioBuffer: mockMp3Buffer,
+      audioBuffer: MOCK_MP3_BUFFER,
       duration: estimatedDuration,
       format: 'mp3'
     };
@@ -370,22 +648,26 @@ class TTSService {
    */
   async cleanup(): Promise<void> {
     try {
-      const files = fs.readdirSync(this.tempDir);
-      const audioFiles = files.filter(file => 
-        file.endsWith('.mp3') || 
-        file.endsWith('.wav') || 
-        file.startsWith('voice_clone_')
-      );
-      
-      const deletePromises = audioFiles.map(file => {
-        const filePath = path.join(this.tempDir, file);
-        return unlink(filePath).catch(() => {}); // Ignore errors
-      });
+      // Stream directory entries instead of blocking the event loop on readdirSync
+      const dir = await fs.promises.opendir(this.tempDir);
+      const deletePromises: Promise<void>[] = [];
+
+      for await (const entry of dir) {
+        const file = entry.name;
+        if (entry.isFile() && (
+          file.endsWith('.mp3') || 
+          file.endsWith('.wav') || 
+          file.startsWith('voice_clone_')
+        )) {
+          const filePath = path.join(this.tempDir, file);
+          deletePromises.push(unlink(filePath).catch(() => {})); // Ignore errors
+        }
+      }
       
       await Promise.all(deletePromises);
-      console.log(`Cleaned up ${audioFiles.length} temporary audio files`);
+      logger.info('Cleaned up %s temporary audio files', deletePromises.length);
     } catch (error) {
-      console.error('TTS Cleanup Error:', error);
+      logger.error('TTS Cleanup Error:', error);
     }
   }
 }
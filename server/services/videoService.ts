@@ -3,9 +3,56 @@ import Asset from '../models/Asset';
 import Lesson, { ILesson } from '../models/Lesson';
 import ttsService from './ttsService';
 import awsService from './awsService';
-import axios from 'axios';
-import mongoose from 'mongoose';
+import { AxiosInstance } from 'axios';
+import mongoose, { UpdateQuery } from 'mongoose';
 import { hasApiKey, isDevelopment } from '../utils/devConfig';
+import { createHttpClient, parseRetryAfter } from '../utils/httpClient';
+import { JobQueue } from '../utils/jobQueue';
+import { CustomError } from '../middleware/errorHandler';
+import logger, { isLevelEnabled } from '../utils/logger';
+
+// Bound how many videos run the TTS + D-ID submission stage at once so a
+// burst of requests doesn't fan out into unbounded upstream calls
+const videoJobQueue = new JobQueue(
+  'Video generation',
+  parseInt(process.env.VIDEO_JOB_CONCURRENCY || '3', 10),
+  parseInt(process.env.VIDEO_JOB_MAX_PENDING || '50', 10)
+);
+
+const DID_HEALTH_TTL_MS = 60 * 1000;
+
+// When set, D-ID reports completion to POST /api/videos/did/webhook and
+// polling is reduced to a safety check once the poll timeout has passed
+const didWebhookUrl = process.env.D_ID_WEBHOOK_URL && process.env.D_ID_WEBHOOK_SECRET
+  ? `${process.env.D_ID_WEBHOOK_URL}?token=${encodeURIComponent(process.env.D_ID_WEBHOOK_SECRET)}`
+  : undefined;
+
+// D-ID result URLs are temporary, so only reuse renders made recently
+const DID_RESULT_REUSE_MS = 12 * 60 * 60 * 1000;
+
+const DID_POLL_TIMEOUT_MS = 5 * 60 * 1000;
+const DID_POLL_INITIAL_DELAY_MS = 1000;
+const DID_POLL_MAX_DELAY_MS = 10 * 1000;
+const DID_POLL_BACKOFF = 1.7;
+// How long the webhook safety check keeps retrying before giving up
+const DID_WEBHOOK_GRACE_MS = 60 * 1000;
+
+// Longest script accepted for video generation; a malformed setting falls
+// back to the default rather than silently disabling the check
+const DEFAULT_MAX_SCRIPT_LENGTH = 10000;
+const configuredMaxScriptLength = Number(process.env.MAX_SCRIPT_LENGTH);
+export const MAX_SCRIPT_LENGTH = Number.isInteger(configuredMaxScriptLength) && configuredMaxScriptLength > 0
+  ? configuredMaxScriptLength
+  : DEFAULT_MAX_SCRIPT_LENGTH;
+
+const queueFullError = (): CustomError => {
+  const error: CustomError = new Error('Video generation queue is full, please try again shortly');
+  error.statusCode = 429;
+  return error;
+};
+
+// Opt-in for the last-resort D-ID retry that renders placeholder text
+const allowPlaceholderVideo = process.env.LEXORA_ALLOW_PLACEHOLDER === 'true';
 
 interface GenerateVideoParams {
   lessonId: string;
@@ -28,6 +75,7 @@ interface DIDCreateTalkRequest {
       voice_id: string;
     };
   };
+  webhook?: string;
   config?: {
     fluent?: boolean;
     pad_audio?: number;
@@ -60,14 +108,25 @@ interface DIDTalkResponse {
 
 class VideoService {
   private didApiKey: string;
+  private hasDIDKey: boolean;
   private didBaseUrl: string;
+  private didClient: AxiosInstance;
+  private didHealth?: { healthy: boolean; checkedAt: number };
+  private didHealthProbe?: Promise<boolean>;
 
   constructor() {
     this.didApiKey = process.env.D_ID_API_KEY || '';
+    this.hasDIDKey = hasApiKey('D_ID_API_KEY');
     this.didBaseUrl = process.env.D_ID_BASE_URL || 'https://api.d-id.com';
+    this.didClient = createHttpClient({
+      baseURL: this.didBaseUrl,
+      headers: {
+        'Authorization': `Basic ${this.didApiKey}`
+      }
+    });
 
     if (!this.didApiKey) {
-      console.warn('D_ID_API_KEY not found in environment variables');
+      logger.warn('D_ID_API_KEY not found in environment variables');
     }
   }
 
@@ -75,23 +134,29 @@ class VideoService {
     const { lessonId, userId, script, avatarId, voiceId } = params;
 
     try {
-      // Get lesson details
-      const lesson = await Lesson.findById(lessonId);
+      // Shed load before creating a record that would never be processed
+      if (videoJobQueue.isFull) {
+        throw queueFullError();
+      }
+
+      logger.debug('Looking up lesson %s and avatar asset %s', lessonId, avatarId);
+
+      // Get lesson details and avatar asset together
+      const [lesson, avatar] = await Promise.all([
+        Lesson.findById(lessonId),
+        Asset.findById(avatarId)
+      ]);
       if (!lesson) {
         throw new Error('Lesson not found');
       }
 
-      console.log(`Looking up avatar asset with ID: ${avatarId}`);
-      
-      // Get avatar asset
-      const avatar = await Asset.findById(avatarId);
       if (!avatar) {
-        console.error(`Avatar asset not found with ID: ${avatarId}`);
+        logger.error('Avatar asset not found with ID: %s', avatarId);
         throw new Error(`Avatar asset not found with ID: ${avatarId}. Please check if the avatar was uploaded properly.`);
       }
       
-      console.log(`Avatar found: ${avatar.fileName} (${avatar.mimeType})`);
-      console.log(`Avatar URL: ${avatar.fileUrl}`);
+      logger.debug('Avatar found: %s (%s)', avatar.fileName, avatar.mimeType);
+      logger.debug('Avatar URL: %s', avatar.fileUrl);
 
       // Create video record with generating status
       const video = await Video.create({
@@ -105,18 +170,25 @@ class VideoService {
         status: 'generating'
       });
 
-      // Start async video generation
-      this.processVideoGeneration(
-        (video._id as mongoose.Types.ObjectId).toString(),
+      // Queue async video generation; the caller polls the video status
+      const videoId = (video._id as mongoose.Types.ObjectId).toString();
+      const queued = videoJobQueue.enqueue(() => this.processVideoGeneration(
+        videoId,
         script,
+        avatarId,
         avatar.fileUrl,
         voiceId,
         lesson.title
-      );
+      ));
+      if (!queued) {
+        // The backlog filled up while the record was being created
+        await Video.findByIdAndDelete(videoId);
+        throw queueFullError();
+      }
 
       return video;
     } catch (error) {
-      console.error('Video Generation Error:', error);
+      logger.error('Video Generation Error:', error);
       throw error;
     }
   }
@@ -124,17 +196,37 @@ class VideoService {
   private async processVideoGeneration(
     videoId: string, 
     script: string, 
+    avatarId: string,
     avatarUrl: string,
     voiceId?: string,
-    lessonTitle?: string
+    lessonTitle?: string,
+    reuseRender: boolean = true
   ) {
     try {
-      console.log(`Starting D-ID video generation for ${videoId}`);
+      logger.info('Starting D-ID video generation for %s', videoId);
       
       // Method 1: Generate audio first with ElevenLabs, then use D-ID with audio URL
       const audioResult = await this.generateAudioFirst(script, voiceId, videoId);
       
       if (audioResult.success && audioResult.audioUrl) {
+        // Speech is content-addressed, so the same avatar + audio URL means an
+        // identical render; reuse a recent one instead of paying for D-ID again
+        const reusable = reuseRender
+          ? await this.findReusableRender(videoId, avatarId, audioResult.audioUrl)
+          : null;
+        if (reusable) {
+          await Video.findByIdAndUpdate(videoId, {
+            videoUrl: reusable.videoUrl,
+            audioUrl: reusable.audioUrl,
+            durationSec: reusable.durationSec,
+            // Carry the original render time so the reuse window can't chain
+            generatedAt: reusable.generatedAt,
+            status: 'completed'
+          });
+          logger.info('Reused render of video %s for %s', reusable._id, videoId);
+          return;
+        }
+
         // Use D-ID with pre-generated audio
         const didResult = await this.createDIDTalkWithAudio(avatarUrl, audioResult.audioUrl);
         await this.pollDIDStatus(videoId, didResult.id, audioResult.audioUrl, audioResult.duration);
@@ -145,7 +237,7 @@ class VideoService {
       }
 
     } catch (error) {
-      console.error(`Video generation failed for ${videoId}:`, error);
+      logger.error('Video generation failed for %s:', videoId, error);
       
       // Update video status to failed
       await Video.findByIdAndUpdate(videoId, {
@@ -154,6 +246,25 @@ class VideoService {
     }
   }
 
+  /**
+   * Find a recent completed video with the same avatar and audio
+   */
+  private async findReusableRender(videoId: string, avatarId: string, audioUrl: string): Promise<IVideo | null> {
+    try {
+      return await Video.findOne({
+        _id: { $ne: videoId },
+        avatarId,
+        audioUrl,
+        status: 'completed',
+        generatedAt: { $gte: new Date(Date.now() - DID_RESULT_REUSE_MS) }
+      }).sort({ generatedAt: -1 });
+    } catch (error) {
+      // A failed lookup only costs us the reuse
+      logger.warn('Render reuse lookup failed:', error);
+      return null;
+    }
+  }
+
   /**
    * Method 1: Generate audio with ElevenLabs first, then use D-ID
    */
@@ -163,7 +274,7 @@ class VideoService {
     duration?: number;
   }> {
     try {
-      console.log('Generating audio with ElevenLabs first...');
+      logger.info('Generating audio with ElevenLabs first...');
       
       const audioResult = await ttsService.generateAndUploadSpeech(
         script,
@@ -177,7 +288,7 @@ class VideoService {
         duration: audioResult.duration
       };
     } catch (error) {
-      console.error('Failed to generate audio first:', error);
+      logger.error('Failed to generate audio first:', error);
       return { success: false };
     }
   }
@@ -327,16 +438,16 @@ class VideoService {
   private async retryDIDRequestWithFallback(originalRequest: DIDCreateTalkRequest, error: any, attempt: number = 1): Promise<DIDTalkResponse> {
     const maxAttempts = 3;
     
-    if (attempt >= maxAttempts) {
-      console.error('D-ID API: All retry attempts exhausted');
+    if (attempt > maxAttempts) {
+      logger.error('D-ID API: All retry attempts exhausted');
       if (isDevelopment) {
-        console.warn('[DEV MODE] Falling back to mock response after retries');
+        logger.warn('[DEV MODE] Falling back to mock response after retries');
         return this.generateMockVideoResponse();
       }
       throw error;
     }
     
-    console.log(`D-ID API: Retry attempt ${attempt}/${maxAttempts}`);
+    logger.info('D-ID API: Retry attempt %s/%s', attempt, maxAttempts);
     
     // Progressive simplification strategies
     let retryRequest = { ...originalRequest };
@@ -347,19 +458,25 @@ class VideoService {
         retryRequest.config = {
           result_format: 'mp4'
         };
-        console.log('D-ID Retry Strategy 1: Simplified config');
+        logger.info('D-ID Retry Strategy 1: Simplified config');
         break;
         
       case 2:
         // Use minimal config
         retryRequest.config = undefined;
-        console.log('D-ID Retry Strategy 2: No config');
+        logger.info('D-ID Retry Strategy 2: No config');
         break;
         
       case 3:
-        // Last resort: switch to text-based if we were using audio
+        // Last resort: switch to text-based if we were using audio. The
+        // placeholder text isn't the lesson, so only allow it when explicitly
+        // enabled rather than shipping a wrong video
+        if (retryRequest.script.type === 'audio' && !allowPlaceholderVideo) {
+          logger.error('D-ID API: Skipping placeholder text retry (LEXORA_ALLOW_PLACEHOLDER not set)');
+          return this.retryDIDRequestWithFallback(originalRequest, error, attempt + 1);
+        }
         if (retryRequest.script.type === 'audio') {
-          console.log('D-ID Retry Strategy 3: Switching from audio to text script');
+          logger.info('D-ID Retry Strategy 3: Switching from audio to text script');
           retryRequest.script = {
             type: 'text',
             input: 'This is a fallback text for video generation.',
@@ -373,22 +490,12 @@ class VideoService {
     }
     
     try {
-      const response = await axios.post<DIDTalkResponse>(
-        `${this.didBaseUrl}/talks`,
-        retryRequest,
-        {
-          headers: {
-            'Authorization': `Basic ${this.didApiKey}`,
-            'Content-Type': 'application/json'
-          },
-          timeout: 30000
-        }
-      );
+      const talk = await this.postTalk(retryRequest);
       
-      console.log(`D-ID API: Retry ${attempt} successful with ID: ${response.data.id}`);
-      return response.data;
+      logger.info('D-ID API: Retry %s successful with ID: %s', attempt, talk.id);
+      return talk;
     } catch (retryError: any) {
-      console.error(`D-ID API: Retry ${attempt} failed:`, retryError.response?.status, retryError.response?.data);
+      logger.error('D-ID API: Retry %s failed:', attempt, retryError.response?.status, retryError.response?.data);
       
       // If it's still a 500 error, try next strategy
       if (retryError.response?.status === 500) {
@@ -401,15 +508,38 @@ class VideoService {
     }
   }
 
+  /**
+   * Submit a talk to D-ID. The webhook is added here, after any request
+   * logging, so its token stays out of the logs.
+   */
+  private async postTalk(requestBody: DIDCreateTalkRequest): Promise<DIDTalkResponse> {
+    const payload = didWebhookUrl
+      ? { ...requestBody, webhook: didWebhookUrl }
+      : requestBody;
+
+    const response = await this.didClient.post<DIDTalkResponse>(
+      '/talks',
+      payload,
+      {
+        headers: {
+          'Content-Type': 'application/json'
+        },
+        timeout: 30000 // 30 seconds timeout
+      }
+    );
+
+    return response.data;
+  }
+
   /**
    * Make the actual D-ID API request with enhanced error handling
    */
   private async makeDIDRequest(requestBody: DIDCreateTalkRequest): Promise<DIDTalkResponse> {
     try {
       // Check if API key is available
-      if (!hasApiKey('D_ID_API_KEY')) {
+      if (!this.hasDIDKey) {
         if (isDevelopment) {
-          console.warn('[DEV MODE] D-ID API key not configured, returning mock response');
+          logger.warn('[DEV MODE] D-ID API key not configured, returning mock response');
           return this.generateMockVideoResponse();
         }
         throw new Error('D-ID API key not configured');
@@ -418,28 +548,23 @@ class VideoService {
       // Sanitize and validate request
       const sanitizedRequest = this.sanitizeDIDRequest(requestBody);
       
-      console.log('Creating D-ID talk with sanitized request:', JSON.stringify(sanitizedRequest, null, 2));
-      console.log('Using D-ID API key:', this.didApiKey ? 'configured' : 'not configured');
-      console.log('D-ID Base URL:', this.didBaseUrl);
-
-      const response = await axios.post<DIDTalkResponse>(
-        `${this.didBaseUrl}/talks`,
-        sanitizedRequest,
-        {
-          headers: {
-            'Authorization': `Basic ${this.didApiKey}`,
-            'Content-Type': 'application/json'
-          },
-          timeout: 30000 // 30 seconds timeout
-        }
-      );
+      if (isLevelEnabled('debug')) {
+        logger.debug('Creating D-ID talk with sanitized request:', JSON.stringify(sanitizedRequest, null, 2));
+        logger.debug('D-ID Base URL:', this.didBaseUrl);
+      }
+
+      const talk = await this.postTalk(sanitizedRequest);
 
-      console.log(`D-ID talk created with ID: ${response.data.id}`);
-      return response.data;
+      logger.info('D-ID talk created with ID: %s', talk.id);
+      return talk;
     } catch (error: any) {
       // Generate diagnostic report
-      const diagnosticReport = this.generateDIDDiagnosticReport(requestBody, error);
-      console.error('D-ID API Diagnostic Report:', diagnosticReport);
+      // Keep the status at error level; the full report (payload analysis
+      // and response body) is only built when debug logging is on
+      logger.error('D-ID API request failed:', error.response?.status || error.message);
+      if (isLevelEnabled('debug')) {
+        logger.debug('D-ID API Diagnostic Report:', this.generateDIDDiagnosticReport(requestBody, error));
+      }
       
       // Handle specific D-ID errors with enhanced logging
       if (error.response?.status === 402) {
@@ -452,22 +577,20 @@ class VideoService {
       
       if (error.response?.status === 400) {
         const errorDetail = error.response?.data?.error?.description || error.response?.data?.detail || 'Invalid request';
-        console.error('D-ID API 400 Error - Request validation failed:', {
-          error: errorDetail,
-          request: requestBody
-        });
+        logger.error('D-ID API 400 Error - Request validation failed:', errorDetail);
+        logger.debug('D-ID API rejected request:', requestBody);
         throw new Error(`D-ID API: ${errorDetail}`);
       }
       
       if (error.response?.status === 500) {
-        console.error('D-ID API 500 Error - Server error detected, attempting retry with fallback');
+        logger.error('D-ID API 500 Error - Server error detected, attempting retry with fallback');
         
         // Try retry with fallback strategies
         try {
           return await this.retryDIDRequestWithFallback(requestBody, error);
         } catch (retryError) {
           if (isDevelopment) {
-            console.warn('[DEV MODE] D-ID API server error after retries, returning mock response');
+            logger.warn('[DEV MODE] D-ID API server error after retries, returning mock response');
             return this.generateMockVideoResponse();
           }
           throw new Error('D-ID API: Internal server error persists after retries. Please try again later.');
@@ -476,7 +599,7 @@ class VideoService {
       
       // For development mode, fall back to mock response for any D-ID API error
       if (isDevelopment) {
-        console.warn(`[DEV MODE] D-ID API error (${error.response?.status || 'unknown'}), returning mock response`);
+        logger.warn('[DEV MODE] D-ID API error (%s), returning mock response', error.response?.status || 'unknown');
         return this.generateMockVideoResponse();
       }
       
@@ -495,7 +618,7 @@ class VideoService {
   ): Promise<void> {
     // Handle development mode with mock response
     if (isDevelopment && didTalkId.startsWith('mock_')) {
-      console.log(`[DEV MODE] Simulating video completion for ${videoId}`);
+      logger.info('[DEV MODE] Simulating video completion for %s', videoId);
       setTimeout(async () => {
         await Video.findByIdAndUpdate(videoId, {
           videoUrl: 'https://example.com/mock-video.mp4',
@@ -503,111 +626,171 @@ class VideoService {
           durationSec: duration || 30,
           status: 'completed'
         });
-        console.log(`[DEV MODE] Mock video generation completed for ${videoId}`);
+        logger.info('[DEV MODE] Mock video generation completed for %s', videoId);
       }, 3000); // 3 second delay to simulate processing
       return;
     }
 
-    const maxAttempts = 60; // 5 minutes with 5-second intervals
+    // Remember the talk so the completion webhook can find this video
+    await Video.findByIdAndUpdate(videoId, {
+      didTalkId,
+      audioUrl: audioUrl || '',
+      durationSec: duration || 0
+    });
+
+    // Back off from quick checks (1s, 1.7s, 2.9s, ... capped at 10s) so short
+    // renders are picked up promptly without hammering D-ID on long ones.
+    // With a webhook the safety check starts at the poll timeout and gets
+    // a grace period of its own before the video is given up on.
+    const deadline = Date.now() + DID_POLL_TIMEOUT_MS + (didWebhookUrl ? DID_WEBHOOK_GRACE_MS : 0);
+    let delay = DID_POLL_INITIAL_DELAY_MS;
     let attempts = 0;
 
+    const scheduleNext = async (retryAfter?: unknown): Promise<void> => {
+      if (Date.now() >= deadline) {
+        if (await this.settleVideo(videoId, didTalkId, { status: 'failed' })) {
+          logger.error('D-ID video generation timed out for %s', videoId);
+        }
+        return;
+      }
+
+      // Never wait past the deadline, even if D-ID asks for longer
+      const wait = Math.min(
+        parseRetryAfter(retryAfter) ?? Math.min(delay, DID_POLL_MAX_DELAY_MS),
+        deadline - Date.now()
+      );
+      delay *= DID_POLL_BACKOFF;
+      setTimeout(poll, wait);
+    };
+
     const poll = async (): Promise<void> => {
       try {
+        // The webhook (or a regeneration) may already have settled the video
+        if (!(await Video.exists({ _id: videoId, status: 'generating', didTalkId }))) {
+          return;
+        }
+
         attempts++;
-        console.log(`Polling D-ID status for talk ${didTalkId}, attempt ${attempts}/${maxAttempts}`);
-
-        const response = await axios.get<DIDTalkResponse>(
-          `${this.didBaseUrl}/talks/${didTalkId}`,
-          {
-            headers: {
-              'Authorization': `Basic ${this.didApiKey}`
-            },
-            timeout: 10000
-          }
+        logger.debug('Polling D-ID status for talk %s, attempt %s', didTalkId, attempts);
+
+        const response = await this.didClient.get<DIDTalkResponse>(
+          `/talks/${didTalkId}`,
+          { timeout: 10000 }
         );
 
         const talk = response.data;
-        console.log(`D-ID talk status: ${talk.status}`);
+        logger.debug('D-ID talk status: %s', talk.status);
 
         switch (talk.status) {
           case 'done':
             // Video generation completed successfully
-            await Video.findByIdAndUpdate(videoId, {
+            await this.settleVideo(videoId, didTalkId, {
               videoUrl: talk.result_url,
               audioUrl: audioUrl || talk.result_url, // Use audio URL if available, otherwise video URL
               durationSec: duration || talk.metadata?.duration || 60,
               status: 'completed'
             });
-            console.log(`Video generation completed for ${videoId}: ${talk.result_url}`);
+            logger.info('Video generation completed for %s: %s', videoId, talk.result_url);
             break;
 
           case 'error':
           case 'rejected':
             // Video generation failed
             const errorMessage = talk.error?.description || 'Unknown error';
-            console.error(`D-ID video generation failed: ${errorMessage}`);
-            await Video.findByIdAndUpdate(videoId, {
-              status: 'failed'
-            });
+            logger.error('D-ID video generation failed: %s', errorMessage);
+            await this.settleVideo(videoId, didTalkId, { status: 'failed' });
             break;
 
           case 'created':
           case 'started':
             // Still processing, continue polling
-            if (attempts < maxAttempts) {
-              setTimeout(poll, 5000); // Poll every 5 seconds
-            } else {
-              // Timeout reached
-              console.error(`D-ID video generation timed out for ${videoId}`);
-              await Video.findByIdAndUpdate(videoId, {
-                status: 'failed'
-              });
-            }
+            await scheduleNext(response.headers['retry-after']);
             break;
 
           default:
-            console.warn(`Unknown D-ID status: ${talk.status}`);
-            if (attempts < maxAttempts) {
-              setTimeout(poll, 5000);
-            } else {
-              await Video.findByIdAndUpdate(videoId, {
-                status: 'failed'
-              });
-            }
-        }
-      } catch (error) {
-        console.error(`Error polling D-ID status:`, error);
-        if (attempts < maxAttempts) {
-          setTimeout(poll, 5000); // Retry on error
-        } else {
-          await Video.findByIdAndUpdate(videoId, {
-            status: 'failed'
-          });
+            logger.warn('Unknown D-ID status: %s', talk.status);
+            await scheduleNext(response.headers['retry-after']);
         }
+      } catch (error: any) {
+        logger.error('Error polling D-ID status:', error);
+        await scheduleNext(error.response?.headers?.['retry-after']); // Retry on error
       }
     };
 
-    // Start polling
-    setTimeout(poll, 2000); // Initial delay of 2 seconds
+    // Start polling; with a webhook configured, only check after the poll
+    // timeout in case the callback never arrives
+    setTimeout(poll, didWebhookUrl ? DID_POLL_TIMEOUT_MS : DID_POLL_INITIAL_DELAY_MS);
+  }
+
+  /**
+   * Apply a final update to a video that is still generating this talk.
+   * Returns false when the webhook or a regeneration already moved it on.
+   */
+  private async settleVideo(videoId: string, didTalkId: string, update: UpdateQuery<IVideo>): Promise<boolean> {
+    const video = await Video.findOneAndUpdate({ _id: videoId, status: 'generating', didTalkId }, update);
+    return video !== null;
+  }
+
+  /**
+   * Apply a D-ID completion webhook to the video rendering that talk.
+   * Returns false when no generating video matches or the status is not final.
+   */
+  async handleDIDWebhook(talk: DIDTalkResponse): Promise<boolean> {
+    const video = await Video.findOne({ didTalkId: talk.id, status: 'generating' });
+    if (!video) {
+      return false;
+    }
+
+    if (talk.status === 'done' && talk.result_url) {
+      video.videoUrl = talk.result_url;
+      video.audioUrl = video.audioUrl || talk.result_url;
+      video.durationSec = video.durationSec || talk.metadata?.duration || 60;
+      video.status = 'completed';
+      logger.info('Video generation completed via webhook for %s: %s', video._id, talk.result_url);
+    } else if (talk.status === 'error' || talk.status === 'rejected') {
+      logger.error('D-ID video generation failed: %s', talk.error?.description || 'Unknown error');
+      video.status = 'failed';
+    } else {
+      return false;
+    }
+
+    await video.save();
+    return true;
   }
 
   /**
-   * Check D-ID service health
+   * Check D-ID service health. The result is reused for a short while and
+   * concurrent callers share one in-flight probe, so monitoring traffic
+   * doesn't turn into a D-ID request per hit.
    */
   async checkDIDHealth(): Promise<boolean> {
+    if (this.didHealth && Date.now() - this.didHealth.checkedAt < DID_HEALTH_TTL_MS) {
+      return this.didHealth.healthy;
+    }
+
+    if (!this.didHealthProbe) {
+      this.didHealthProbe = this.probeDIDHealth()
+        .then(healthy => {
+          this.didHealth = { healthy, checkedAt: Date.now() };
+          return healthy;
+        })
+        .finally(() => {
+          this.didHealthProbe = undefined;
+        });
+    }
+
+    return this.didHealthProbe;
+  }
+
+  private async probeDIDHealth(): Promise<boolean> {
     try {
       // D-ID doesn't have a dedicated health endpoint, so we'll check credits
-      const response = await axios.get(`${this.didBaseUrl}/credits`, {
-        headers: {
-          'Authorization': `Basic ${this.didApiKey}`
-        },
-        timeout: 5000
-      });
+      const response = await this.didClient.get('/credits', { timeout: 5000 });
       
-      console.log('D-ID service is healthy, credits:', response.data);
+      logger.debug('D-ID service is healthy, credits:', response.data);
       return true;
     } catch (error) {
-      console.error('D-ID health check failed:', error);
+      logger.error('D-ID health check failed:', error);
       return false;
     }
   }
@@ -617,7 +800,7 @@ class VideoService {
       const video = await Video.findById(videoId);
       return video;
     } catch (error) {
-      console.error('Get Video Status Error:', error);
+      logger.error('Get Video Status Error:', error);
       throw error;
     }
   }
@@ -629,9 +812,9 @@ class VideoService {
         throw new Error('Video not found');
       }
 
-      // Reset status to generating
-      video.status = 'generating';
-      await video.save();
+      if (videoJobQueue.isFull) {
+        throw queueFullError();
+      }
 
       // Get avatar asset
       const avatar = await Asset.findById(video.avatarId);
@@ -641,19 +824,38 @@ class VideoService {
 
       // Get the populated lesson to access the script
       const lesson = video.lessonId as unknown as ILesson;
+      if (lesson.script.length > MAX_SCRIPT_LENGTH) {
+        const error: CustomError = new Error(`Lesson script must be at most ${MAX_SCRIPT_LENGTH} characters for video generation`);
+        error.statusCode = 400;
+        throw error;
+      }
+
+      // Reset status to generating, keeping the old one in case the queue
+      // turns the job away
+      const previousStatus = video.status;
+      video.status = 'generating';
+      await video.save();
       
-      // Start regeneration process
-      this.processVideoGeneration(
+      // Queue regeneration process
+      // Regeneration asks for a fresh render, so never reuse an earlier one
+      const queued = videoJobQueue.enqueue(() => this.processVideoGeneration(
         videoId, 
         lesson.script, 
+        video.avatarId.toString(),
         avatar.fileUrl,
         video.voiceId?.toString(),
-        lesson.title
-      );
+        lesson.title,
+        false
+      ));
+      if (!queued) {
+        video.status = previousStatus;
+        await video.save();
+        throw queueFullError();
+      }
 
       return video;
     } catch (error) {
-      console.error('Video Regeneration Error:', error);
+      logger.error('Video Regeneration Error:', error);
       throw error;
     }
   }
@@ -665,7 +867,7 @@ class VideoService {
     try {
       return await ttsService.getAvailableVoices();
     } catch (error) {
-      console.error('Failed to get available voices:', error);
+      logger.error('Failed to get available voices:', error);
       return [];
     }
   }
@@ -675,7 +877,7 @@ class VideoService {
    */
   private generateMockVideoResponse(): DIDTalkResponse {
     const mockId = `mock_${Date.now()}`;
-    console.log(`[DEV MODE] Generated mock D-ID response with ID: ${mockId}`);
+    logger.info('[DEV MODE] Generated mock D-ID response with ID: %s', mockId);
     
     return {
       id: mockId,
@@ -699,9 +901,9 @@ class VideoService {
   async cleanup() {
     try {
       await ttsService.cleanup();
-      console.log('Video service cleanup completed');
+      logger.info('Video service cleanup completed');
     } catch (error) {
-      console.error('Failed to cleanup video service:', error);
+      logger.error('Failed to cleanup video service:', error);
     }
   }
 }
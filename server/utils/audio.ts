@@ -0,0 +1,28 @@
+/**
+ * Audio helpers
+ * Duration math for the constant-bitrate MP3 requested from ElevenLabs
+ */
+
+import { Transform, TransformCallback } from 'stream';
+
+// A constant bitrate lets the duration follow directly from the byte size
+export const SPEECH_OUTPUT_FORMAT = 'mp3_44100_128';
+const SPEECH_BITRATE = 128000; // bits per second
+
+/**
+ * Duration in whole seconds of a SPEECH_OUTPUT_FORMAT MP3 of the given size
+ */
+export const getMp3Duration = (byteLength: number): number =>
+  Math.ceil((byteLength * 8) / SPEECH_BITRATE);
+
+/**
+ * Pass-through stream that counts the bytes flowing through it
+ */
+export class ByteCounter extends Transform {
+  bytes = 0;
+
+  _transform(chunk: Buffer, _encoding: BufferEncoding, callback: TransformCallback): void {
+    this.bytes += chunk.length;
+    callback(null, chunk);
+  }
+}
@@ -2,11 +2,14 @@
  * Utility helper functions
  */
 
+const REGEXP_SPECIAL_CHARS = /[.*+?^${}()|[\]\\]/g;
+const NON_WORD_CHARS = /[^\w\s]/g;
+
 /**
  * Escape special characters in a string for use in a regular expression
  */
 export function escapeRegExp(string: string): string {
-  return string.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+  return string.replace(REGEXP_SPECIAL_CHARS, '\\$&');
 }
 
 /**
@@ -20,7 +23,7 @@ export function createSearchRegex(query: string): RegExp {
  * Sanitize search query by removing special characters
  */
 export function sanitizeSearchQuery(query: string): string {
-  return query.replace(/[^\w\s]/g, '').trim();
+  return query.replace(NON_WORD_CHARS, '').trim();
 }
 
 /**
@@ -32,7 +35,8 @@ export function buildSearchPipeline(
   additionalFilters: any = {}
 ) {
   const sanitizedQuery = sanitizeSearchQuery(query);
-  const searchRegex = createSearchRegex(sanitizedQuery);
+  // Sanitizing already removed every regex special character, so skip escaping
+  const searchRegex = new RegExp(sanitizedQuery, 'i');
   
   const searchConditions = fields.map(field => ({
     [field]: { $regex: searchRegex }
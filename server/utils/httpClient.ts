@@ -0,0 +1,85 @@
+/**
+ * Shared HTTP client helper
+ * Keeps TCP/TLS connections to external APIs alive between requests and
+ * retries idempotent calls on transient failures
+ */
+
+import axios, { AxiosError, AxiosInstance, CreateAxiosDefaults, InternalAxiosRequestConfig } from 'axios';
+import http from 'http';
+import https from 'https';
+
+const MAX_SOCKETS = 32;
+const MAX_RETRIES = 3;
+const RETRY_BACKOFF_MS = 300;
+const RETRY_STATUSES = [429, 500, 502, 503, 504];
+const RETRY_METHODS = ['get', 'head', 'delete', 'options'];
+// Longer Retry-After waits are left to the caller instead of stalling here
+const MAX_RETRY_AFTER_MS = 10 * 1000;
+
+export const httpAgent = new http.Agent({ keepAlive: true, maxSockets: MAX_SOCKETS });
+export const httpsAgent = new https.Agent({ keepAlive: true, maxSockets: MAX_SOCKETS });
+
+/**
+ * Parse a Retry-After header (seconds or HTTP date) into milliseconds
+ */
+export const parseRetryAfter = (header: unknown): number | undefined => {
+  if (header === undefined || header === null || header === '') {
+    return undefined;
+  }
+
+  const seconds = Number(header);
+  if (!Number.isNaN(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+
+  const date = Date.parse(String(header));
+  return Number.isNaN(date) ? undefined : Math.max(0, date - Date.now());
+};
+
+type RetryableConfig = InternalAxiosRequestConfig & { retryCount?: number };
+
+const shouldRetry = (error: AxiosError, config: RetryableConfig): boolean => {
+  if (!RETRY_METHODS.includes((config.method || 'get').toLowerCase())) {
+    return false;
+  }
+
+  if ((config.retryCount || 0) >= MAX_RETRIES) {
+    return false;
+  }
+
+  // Retry network errors (e.g. a kept-alive socket closed by the server)
+  // and transient upstream statuses
+  return !error.response || RETRY_STATUSES.includes(error.response.status);
+};
+
+/**
+ * Create an axios instance that reuses pooled keep-alive connections
+ */
+export const createHttpClient = (config: CreateAxiosDefaults = {}): AxiosInstance => {
+  const client = axios.create({
+    httpAgent,
+    httpsAgent,
+    ...config
+  });
+
+  client.interceptors.response.use(undefined, async (error: AxiosError) => {
+    const requestConfig = error.config as RetryableConfig | undefined;
+    if (!requestConfig || !shouldRetry(error, requestConfig)) {
+      throw error;
+    }
+
+    // A rate-limited upstream says when to come back; honour it
+    const retryAfter = parseRetryAfter(error.response?.headers?.['retry-after']);
+    if (retryAfter !== undefined && retryAfter > MAX_RETRY_AFTER_MS) {
+      throw error;
+    }
+
+    requestConfig.retryCount = (requestConfig.retryCount || 0) + 1;
+    const delay = retryAfter ?? RETRY_BACKOFF_MS * 2 ** (requestConfig.retryCount - 1);
+    await new Promise(resolve => setTimeout(resolve, delay));
+
+    return client.request(requestConfig);
+  });
+
+  return client;
+};
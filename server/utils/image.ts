@@ -0,0 +1,42 @@
+/**
+ * Image helpers
+ * Avatar images are downscaled once on upload so D-ID fetches and decodes
+ * a frame-sized picture instead of whatever the user's camera produced
+ */
+
+import sharp from 'sharp';
+
+// D-ID renders talks well under this size, so larger sources are wasted bytes
+export const AVATAR_MAX_DIMENSION = 1024;
+
+// Animated GIFs are left alone; only still formats are re-encoded
+const RESIZABLE_TYPES = new Set(['image/jpeg', 'image/png']);
+
+/**
+ * Fit an avatar within AVATAR_MAX_DIMENSION, keeping its format and aspect ratio.
+ * Images that already fit are returned untouched
+ */
+export const resizeAvatar = async (buffer: Buffer, mimeType: string): Promise<Buffer> => {
+  if (!RESIZABLE_TYPES.has(mimeType)) {
+    return buffer;
+  }
+
+  const image = sharp(buffer);
+  const { width = 0, height = 0, orientation = 1 } = await image.metadata();
+
+  // Already small enough and upright: keep the original bytes, no re-encode
+  if (width <= AVATAR_MAX_DIMENSION && height <= AVATAR_MAX_DIMENSION && orientation === 1) {
+    return buffer;
+  }
+
+  image
+    .rotate() // Apply EXIF orientation before the metadata is dropped
+    .resize(AVATAR_MAX_DIMENSION, AVATAR_MAX_DIMENSION, {
+      fit: 'inside',
+      withoutEnlargement: true
+    });
+
+  return mimeType === 'image/png'
+    ? image.png().toBuffer()
+    : image.jpeg({ quality: 90, mozjpeg: true }).toBuffer();
+};
@@ -0,0 +1,53 @@
+/**
+ * In-process background job queue
+ * Runs fire-and-forget jobs with a bounded number in flight at once and a
+ * bounded backlog, so callers can shed load instead of queueing forever
+ */
+
+type Job = () => Promise<void>;
+
+export class JobQueue {
+  private pending: Job[] = [];
+  private running = 0;
+
+  constructor(
+    private name: string,
+    private concurrency: number,
+    private maxPending: number = Infinity
+  ) {}
+
+  /**
+   * Whether the backlog is full and new jobs would be rejected
+   */
+  get isFull(): boolean {
+    return this.running >= this.concurrency && this.pending.length >= this.maxPending;
+  }
+
+  /**
+   * Queue a job; it starts as soon as a slot is free. Returns false, without
+   * queueing, when the backlog is full
+   */
+  enqueue(job: Job): boolean {
+    if (this.isFull) {
+      return false;
+    }
+
+    this.pending.push(job);
+    this.drain();
+    return true;
+  }
+
+  private drain(): void {
+    while (this.running < this.concurrency && this.pending.length > 0) {
+      const job = this.pending.shift()!;
+      this.running++;
+
+      job()
+        .catch(error => console.error(`${this.name} job failed:`, error))
+        .finally(() => {
+          this.running--;
+          this.drain();
+        });
+    }
+  }
+}
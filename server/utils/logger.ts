@@ -0,0 +1,47 @@
+/**
+ * Level-gated application logger
+ * Thin wrapper over console so verbose diagnostics can be filtered out in
+ * production with LOG_LEVEL (debug | info | warn | error). Pass values as
+ * printf-style arguments ('%s') so filtered messages are never formatted
+ */
+
+const LEVELS = {
+  debug: 10,
+  info: 20,
+  warn: 30,
+  error: 40
+} as const;
+
+export type LogLevel = keyof typeof LEVELS;
+
+const resolveLevel = (): LogLevel => {
+  const level = (process.env.LOG_LEVEL || '').toLowerCase();
+  if (level in LEVELS) {
+    return level as LogLevel;
+  }
+  return process.env.NODE_ENV === 'production' ? 'info' : 'debug';
+};
+
+const threshold = LEVELS[resolveLevel()];
+
+/**
+ * Check a level before building an expensive message (e.g. JSON dumps)
+ */
+export const isLevelEnabled = (level: LogLevel): boolean => LEVELS[level] >= threshold;
+
+const logger = {
+  debug: (...args: unknown[]): void => {
+    if (isLevelEnabled('debug')) console.debug(...args);
+  },
+  info: (...args: unknown[]): void => {
+    if (isLevelEnabled('info')) console.log(...args);
+  },
+  warn: (...args: unknown[]): void => {
+    if (isLevelEnabled('warn')) console.warn(...args);
+  },
+  error: (...args: unknown[]): void => {
+    if (isLevelEnabled('error')) console.error(...args);
+  }
+};
+
+export default logger;
@@ -0,0 +1,22 @@
+/**
+ * Upload validation rules
+ * Shared by the asset controller and the S3 upload middleware so both
+ * accept the same files
+ */
+
+export const MAX_UPLOAD_SIZE = 50 * 1024 * 1024; // 50MB limit
+
+// Images, videos, and audio files
+export const ALLOWED_MIME_TYPES: ReadonlySet<string> = new Set([
+  'image/jpeg',
+  'image/png',
+  'image/gif',
+  'video/mp4',
+  'video/avi',
+  'video/mov',
+  'audio/mp3',
+  'audio/wav',
+  'audio/mpeg'
+]);
+
+export const isAllowedMimeType = (mimeType: string): boolean => ALLOWED_MIME_TYPES.has(mimeType);
@@ -4,19 +4,21 @@ async function testAPIs() {
     console.log('🧪 Testing API Configuration...\n');
     
     try {
-        // Test configuration status
-        const configResponse = await axios.get('http://localhost:5000/api/config/status');
+        // The checks are independent, so run them together
+        const [configResponse, healthResponse, didHealthResponse] = await Promise.all([
+            // Test configuration status
+            axios.get('http://localhost:5000/api/config/status'),
+            // Test health endpoint
+            axios.get('http://localhost:5000/api/health'),
+            // Test D-ID health (if available)
+            axios.get('http://localhost:5000/api/videos/did/health').catch(() => null)
+        ]);
         console.log('✅ Configuration Status:', configResponse.data);
-        
-        // Test health endpoint
-        const healthResponse = await axios.get('http://localhost:5000/api/health');
         console.log('✅ Health Status:', healthResponse.data);
         
-        // Test D-ID health (if available)
-        try {
-            const didHealthResponse = await axios.get('http://localhost:5000/api/videos/did/health');
+        if (didHealthResponse) {
             console.log('✅ D-ID Health:', didHealthResponse.data);
-        } catch (error) {
+        } else {
             console.log('⚠️  D-ID Health check failed (expected in dev mode)');
         }
         
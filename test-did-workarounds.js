@@ -56,17 +56,24 @@ async function testDIDWorkarounds() {
         }
     ];
     
-    for (const testCase of testCases) {
+    // Submit every case at once; results are reported in order below
+    console.log(`🧪 Testing ${testCases.length} request formats in parallel...\n`);
+    const results = await Promise.allSettled(testCases.map(testCase =>
+        axios.post(`${baseUrl}/talks`, testCase.payload, {
+            headers: {
+                'Authorization': `Basic ${apiKey}`,
+                'Content-Type': 'application/json'
+            },
+            timeout: 30000
+        })
+    ));
+    
+    testCases.forEach((testCase, index) => {
+        const result = results[index];
         console.log(`🧪 Testing: ${testCase.name}`);
         
-        try {
-            const response = await axios.post(`${baseUrl}/talks`, testCase.payload, {
-                headers: {
-                    'Authorization': `Basic ${apiKey}`,
-                    'Content-Type': 'application/json'
-                },
-                timeout: 30000
-            });
+        if (result.status === 'fulfilled') {
+            const response = result.value;
             
             console.log(`✅ ${testCase.name} - SUCCESS`);
             console.log('Talk ID:', response.data.id);
@@ -92,7 +99,8 @@ async function testDIDWorkarounds() {
                 }
             }, 2000);
             
-        } catch (error) {
+        } else {
+            const error = result.reason;
             console.log(`❌ ${testCase.name} - FAILED`);
             console.log('Status:', error.response?.status);
             console.log('Error:', error.response?.data?.kind || error.message);
@@ -102,7 +110,7 @@ async function testDIDWorkarounds() {
             }
             console.log('');
         }
-    }
+    });
     
     // Test different HTTP methods and headers
     console.log('🔍 Testing alternative approaches...');